@@ -1,11 +1,17 @@
 from random import Random
 
+_MASK64 = 0xFFFFFFFFFFFFFFFF
+
 
 class BasePokerAgent:
+    # Subclasses without their own __slots__ still get a __dict__ as usual
+    __slots__ = ("name", "seed", "_random", "_rng_state")
+
     def __init__(self, seed: int = None, name: str = "Base Agent"):
         self.name = name
         self.seed = None
         self._random = None
+        self._rng_state = None
         self.init_seed(seed)
 
     def __repr__(self):
@@ -14,6 +20,20 @@ class BasePokerAgent:
     def init_seed(self, seed: int):
         self.seed = seed
         self._random = Random(seed)
+        # xorshift64 state for _rand_lt, derived from the same seed
+        self._rng_state = (seed or 0xDEADBEEF) | 1
+
+    def _rand_lt(self, thresh_num: int) -> bool:
+        """
+        Cheap seeded coin flip: True with probability thresh_num / 256.
+        Steps an inline xorshift64 instead of calling self._random.random().
+        """
+        s = self._rng_state
+        s ^= (s << 13) & _MASK64
+        s ^= s >> 7
+        s ^= (s << 17) & _MASK64
+        self._rng_state = s
+        return (s & 0xFF) < thresh_num
 
     def game_start(self, start_state):
         """
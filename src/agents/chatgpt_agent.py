@@ -1,6 +1,124 @@
 from .base_agent import BasePokerAgent
+from bisect import bisect_left
+from operator import itemgetter
 from typing import List, Dict, Tuple
 import math
+import sys
+
+
+# Rank index ('2' = 0 ... 'A' = 12) addressed by ord() of the rank character,
+# so parsing a card is a single byte load instead of a str.index() scan.
+RANKS = "23456789TJQKA"
+_RANK = bytes(RANKS.index(chr(i)) if chr(i) in RANKS else 0 for i in range(128))
+
+# Per-card counter lanes: 3 bits per rank (bits 0-38) and 4 bits per suit
+# (bits 40-55). Summing the lanes of a hand counts every rank and suit at once,
+# so evaluating 5, 6 or 7 cards is the same single C-level pass.
+_SUITS = "shdc"
+_CARD_LANES = {
+    rank + suit: (1 << (3 * r)) | (1 << (40 + 4 * s))
+    for r, rank in enumerate(RANKS)
+    for s, suit in enumerate(_SUITS)
+}
+_RANK_LANES = (1 << 39) - 1
+_LANE_LOW_BITS = int("001" * 13, 2)
+
+# Interned action keys and values shared by every returned action dict
+_ACTION_KEY = sys.intern("action")
+_AMOUNT_KEY = sys.intern("amount")
+_FOLD_ACTION = sys.intern("fold")
+_MATCH_ACTION = sys.intern("match")
+_INCREASE_ACTION = sys.intern("increase")
+
+# Shared fold/match actions; returned as-is, so they must not be mutated
+_FOLD = {_ACTION_KEY: _FOLD_ACTION}
+_MATCH = {_ACTION_KEY: _MATCH_ACTION}
+
+_GET_AMOUNT = itemgetter("amount")
+_GET_PLAYER_ID = itemgetter("player_id")
+_GET_HOLE_CARDS = itemgetter("hole_cards")
+
+# Opening thresholds per position (0-9) for the mid and deep stack strategies
+_OPEN_MID = tuple(0.45 - position * 0.015 for position in range(10))
+_OPEN_DEEP = tuple(0.40 - position * 0.02 for position in range(10))
+
+
+def _preflop_formula(r1: int, r2: int, suited: bool) -> float:
+    """
+    Returns normalized [0,1] strength.
+
+    Heuristic model:
+    - Pair strength
+    - High card value
+    - Suited bonus
+    - Connected bonus
+    """
+
+    high = max(r1, r2)
+    low = min(r1, r2)
+
+    # Pair
+    if r1 == r2:
+        return 0.6 + (high / 12) * 0.4
+
+    strength = (high / 12) * 0.6 + (low / 12) * 0.2
+
+    if suited:
+        strength += 0.05
+
+    if abs(r1 - r2) == 1:
+        strength += 0.05
+
+    return min(strength, 1.0)
+
+
+def _preflop_key(r1: int, r2: int, suited: bool) -> int:
+    """Canonical starting hand key: (high << 5) | (low << 1) | suited."""
+    return (max(r1, r2) << 5) | (min(r1, r2) << 1) | (r1 != r2 and suited)
+
+
+# Strength of every distinct starting hand (13 pairs + 78 suited + 78 offsuit)
+_PREFLOP = {
+    _preflop_key(r1, r2, suited): _preflop_formula(r1, r2, suited)
+    for r1 in range(13)
+    for r2 in range(13)
+    for suited in (False, True)
+}
+
+
+def _postflop_strength(hole: int, community: int) -> float:
+    """
+    Integer kernel behind _evaluate_postflop_strength.
+
+    Takes the summed _CARD_LANES of the hole cards and of the board, so
+    callers that already hold encoded cards can skip string parsing.
+    """
+
+    counts = hole + community
+
+    # Trips+: a rank lane holding 3 (0b011) or 4 (0b100)
+    if ((counts >> 2) | (counts & (counts >> 1))) & _LANE_LOW_BITS:
+        return 0.9
+
+    # Two pair (without trips a lane's middle bit means exactly a pair)
+    pairs = ((counts >> 1) & _LANE_LOW_BITS).bit_count()
+    if pairs >= 2:
+        return 0.8
+
+    # One pair
+    if pairs == 1:
+        return 0.6
+
+    # Flush draw detection: some suit lane has reached 4
+    if (counts >> 40) & 0xCCCC:
+        return 0.5
+
+    # Overcards heuristic (no pairs here, so the top set bit is the top rank)
+    if hole and community:
+        if (hole & _RANK_LANES).bit_length() > (community & _RANK_LANES).bit_length():
+            return 0.45
+
+    return 0.2
 
 
 class ChatgptAgent(BasePokerAgent):
@@ -13,7 +131,9 @@ class ChatgptAgent(BasePokerAgent):
     - Positionally aware.
     - Exploitatively adaptive using simple opponent stats.
     - Risk-adjusted aggression (ICM-lite via stack preservation when short).
-    - Deterministic except for controlled randomness via self._random.
+    - Deterministic except for one seeded coin: the postflop medium-strength
+      bet fires on _rand_lt(102), i.e. with probability 102/256 (~0.398),
+      from the xorshift state BasePokerAgent.init_seed derives from the seed.
 
     No ML. Fully rule-based and interpretable.
     """
@@ -21,6 +141,11 @@ class ChatgptAgent(BasePokerAgent):
     def __init__(self, seed: int = None, name: str = "ChatGPT Agent"):
         super().__init__(seed, name)
 
+        # Hand strength of the last cards we evaluated, reused while the
+        # same street is bet around more than once
+        self._strength_key = None
+        self._strength = 0.0
+
     # -------------------------- #
     #        GAME LIFECYCLE      #
     # -------------------------- #
@@ -32,17 +157,17 @@ class ChatgptAgent(BasePokerAgent):
         self.my_id = start_state["your_status"]["player_id"]
 
         # Opponent modeling database
-        # player_id -> stats
-        self.opponent_stats = {}
-        for p in start_state["players"]:
-            if p["player_id"] != self.my_id:
-                self.opponent_stats[p["player_id"]] = {
-                    "hands": 0,
-                    "vpip": 0,      # voluntarily put money in preflop
-                    "pfr": 0,       # preflop raise
-                    "showdowns": 0,
-                    "aggressive_actions": 0,
-                }
+        # One list per stat, indexed by the opponent's slot
+        self.opponent_ids = [
+            p["player_id"] for p in start_state["players"] if p["player_id"] != self.my_id
+        ]
+        self._pid_to_slot = {pid: slot for slot, pid in enumerate(self.opponent_ids)}
+        n = len(self.opponent_ids)
+        self.opp_hands = [0] * n
+        self.opp_vpip = [0] * n         # voluntarily put money in preflop
+        self.opp_pfr = [0] * n          # preflop raise
+        self.opp_showdowns = [0] * n
+        self.opp_aggressive_actions = [0] * n
 
         self.hand_counter = 0
 
@@ -52,171 +177,136 @@ class ChatgptAgent(BasePokerAgent):
 
     def decide_action(self, game_state: Dict) -> Dict:
         stage = game_state["current_stage"]
+        hole_cards = game_state["hole_cards"]
+        board = game_state["community_cards"]
+
+        key = (*hole_cards, *board)
+        if key == self._strength_key:
+            strength = self._strength
+        else:
+            if stage == "pre-flop":
+                strength = self._evaluate_preflop_strength(hole_cards)
+            else:
+                strength = self._evaluate_postflop_strength(hole_cards, board)
+            self._strength_key = key
+            self._strength = strength
 
         if stage == "pre-flop":
-            return self._decide_preflop(game_state)
+            return self._decide_preflop(game_state, strength)
         else:
-            return self._decide_postflop(game_state)
+            return self._decide_postflop(game_state, strength)
 
     # -------------------------- #
     #        PRE-FLOP LOGIC      #
     # -------------------------- #
 
-    def _decide_preflop(self, game_state: Dict) -> Dict:
-        hole_cards = game_state["hole_cards"]
+    def _decide_preflop(self, game_state: Dict, hand_strength: float) -> Dict:
         bb = game_state["big_blind"]
         stack = game_state["your_status"]["stack"]
-        cost_to_match = game_state["cost_to_match"]
-        min_cost_to_increase = game_state["min_cost_to_increase"]
-        can_raise = game_state["your_status"]["can_raise"]
-        position = game_state["your_status"]["position"]
 
+        # Short stack push/fold (<=15bb), mid stack (15–30bb), deep stack (>30bb)
         effective_bb = stack / bb
-
-        hand_strength = self._evaluate_preflop_strength(hole_cards)
-
-        # -------- SHORT STACK PUSH/FOLD (<15bb) -------- #
-        if effective_bb <= 15:
-            return self._short_stack_strategy(
-                hand_strength,
-                effective_bb,
-                cost_to_match,
-                min_cost_to_increase,
-                stack,
-                can_raise,
-            )
-
-        # -------- MID STACK (15–30bb) -------- #
-        elif effective_bb <= 30:
-            return self._mid_stack_strategy(
-                hand_strength,
-                position,
-                cost_to_match,
-                min_cost_to_increase,
-                bb,
-                stack,
-                can_raise,
-            )
-
-        # -------- DEEP STACK (>30bb) -------- #
-        else:
-            return self._deep_stack_strategy(
-                hand_strength,
-                position,
-                cost_to_match,
-                min_cost_to_increase,
-                bb,
-                stack,
-                can_raise,
-            )
+        strategy = _STACK_STRATEGIES[bisect_left(_STACK_LIMITS, effective_bb)]
+        return strategy(self, game_state, hand_strength, effective_bb)
 
     # -------------------------- #
     #      SHORT STACK LOGIC     #
     # -------------------------- #
 
-    def _short_stack_strategy(
-        self,
-        strength: float,
-        effective_bb: float,
-        cost_to_match: int,
-        min_cost_to_increase: int,
-        stack: int,
-        can_raise: bool,
-    ) -> Dict:
+    def _short_stack_strategy(self, game_state: Dict, strength: float, effective_bb: float) -> Dict:
+        cost_to_match = game_state["cost_to_match"]
+        stack = game_state["your_status"]["stack"]
+        can_raise = game_state["your_status"]["can_raise"]
 
         # Jam range expands as stack gets shorter
         shove_threshold = 0.55 - (15 - effective_bb) * 0.015
 
         if strength >= shove_threshold and can_raise:
-            return {"action": "increase", "amount": stack}
+            return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: stack}
 
         if cost_to_match == 0:
-            return {"action": "match"}
+            return _MATCH
 
         if strength >= shove_threshold - 0.05:
-            return {"action": "match"}
+            return _MATCH
 
-        return {"action": "fold"}
+        return _FOLD
 
     # -------------------------- #
     #       MID STACK LOGIC      #
     # -------------------------- #
 
-    def _mid_stack_strategy(
-        self,
-        strength: float,
-        position: int,
-        cost_to_match: int,
-        min_cost_to_increase: int,
-        bb: int,
-        stack: int,
-        can_raise: bool,
-    ) -> Dict:
-
-        open_threshold = 0.45 - position * 0.015
+    def _mid_stack_strategy(self, game_state: Dict, strength: float, effective_bb: float) -> Dict:
+        my_status = game_state["your_status"]
+        position = my_status["position"]
+        stack = my_status["stack"]
+        can_raise = my_status["can_raise"]
+        cost_to_match = game_state["cost_to_match"]
+        min_cost_to_increase = game_state["min_cost_to_increase"]
+        bb = game_state["big_blind"]
+
+        open_threshold = _OPEN_MID[position]
         reraise_threshold = 0.65
 
         if cost_to_match == 0:
             if strength >= open_threshold and can_raise:
                 raise_size = int(2.2 * bb)
-                return {"action": "increase", "amount": max(raise_size, min_cost_to_increase)}
-            return {"action": "match"}
+                return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: max(raise_size, min_cost_to_increase)}
+            return _MATCH
 
         # Facing raise
         if strength >= reraise_threshold and can_raise:
-            return {"action": "increase", "amount": stack}
+            return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: stack}
 
         if strength >= open_threshold:
-            return {"action": "match"}
+            return _MATCH
 
-        return {"action": "fold"}
+        return _FOLD
 
     # -------------------------- #
     #       DEEP STACK LOGIC     #
     # -------------------------- #
 
-    def _deep_stack_strategy(
-        self,
-        strength: float,
-        position: int,
-        cost_to_match: int,
-        min_cost_to_increase: int,
-        bb: int,
-        stack: int,
-        can_raise: bool,
-    ) -> Dict:
-
-        open_threshold = 0.40 - position * 0.02
+    def _deep_stack_strategy(self, game_state: Dict, strength: float, effective_bb: float) -> Dict:
+        my_status = game_state["your_status"]
+        position = my_status["position"]
+        stack = my_status["stack"]
+        can_raise = my_status["can_raise"]
+        cost_to_match = game_state["cost_to_match"]
+        min_cost_to_increase = game_state["min_cost_to_increase"]
+        bb = game_state["big_blind"]
+
+        open_threshold = _OPEN_DEEP[position]
         threebet_threshold = 0.70
 
         if cost_to_match == 0:
             if strength >= open_threshold and can_raise:
                 raise_size = int(2.5 * bb)
-                return {"action": "increase", "amount": max(raise_size, min_cost_to_increase)}
-            return {"action": "match"}
+                return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: max(raise_size, min_cost_to_increase)}
+            return _MATCH
 
         if strength >= threebet_threshold and can_raise:
             raise_size = int(3 * cost_to_match)
             raise_size = min(raise_size, stack)
-            return {"action": "increase", "amount": max(raise_size, min_cost_to_increase)}
+            return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: max(raise_size, min_cost_to_increase)}
 
         if strength >= open_threshold + 0.05:
-            return {"action": "match"}
+            return _MATCH
 
-        return {"action": "fold"}
+        return _FOLD
 
     # -------------------------- #
     #       POST-FLOP LOGIC      #
     # -------------------------- #
 
-    def _decide_postflop(self, game_state: Dict) -> Dict:
-        hole_cards = game_state["hole_cards"]
-        board = game_state["community_cards"]
+    def _decide_postflop(self, game_state: Dict, strength: float) -> Dict:
         stage = game_state["current_stage"]
 
-        strength = self._evaluate_postflop_strength(hole_cards, board)
-
-        pot = sum(p["amount"] for p in game_state["pots"])
+        pots = game_state["pots"]
+        if len(pots) == 1:
+            pot = pots[0]["amount"]
+        else:
+            pot = sum(map(_GET_AMOUNT, pots))
         cost_to_match = game_state["cost_to_match"]
         min_cost_to_increase = game_state["min_cost_to_increase"]
         stack = game_state["your_status"]["stack"]
@@ -230,30 +320,30 @@ class ChatgptAgent(BasePokerAgent):
         if strength > 0.80 and can_raise:
             bet_size = int(pot * 0.75)
             bet_size = min(bet_size, stack)
-            return {"action": "increase", "amount": max(bet_size, min_cost_to_increase)}
+            return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: max(bet_size, min_cost_to_increase)}
 
         # Medium strength
         if strength > 0.55:
             if cost_to_match == 0:
-                if can_raise and self._random.random() < 0.4:
+                if can_raise and self._rand_lt(102):  # 102/256 ~ 0.398
                     bet_size = int(pot * 0.5)
-                    return {"action": "increase", "amount": max(bet_size, min_cost_to_increase)}
-                return {"action": "match"}
+                    return {_ACTION_KEY: _INCREASE_ACTION, _AMOUNT_KEY: max(bet_size, min_cost_to_increase)}
+                return _MATCH
 
             if strength > pot_odds:
-                return {"action": "match"}
+                return _MATCH
 
-            return {"action": "fold"}
+            return _FOLD
 
         # Draw logic
         if 0.35 < strength <= 0.55:
             if cost_to_match == 0:
-                return {"action": "match"}
+                return _MATCH
 
             if strength > pot_odds:
-                return {"action": "match"}
+                return _MATCH
 
-        return {"action": "fold"}
+        return _FOLD
 
     # -------------------------- #
     #      HAND EVALUATION       #
@@ -261,36 +351,32 @@ class ChatgptAgent(BasePokerAgent):
 
     def _evaluate_preflop_strength(self, hole_cards: List[str]) -> float:
         """
-        Returns normalized [0,1] strength.
-
-        Heuristic model:
-        - Pair strength
-        - High card value
-        - Suited bonus
-        - Connected bonus
+        Returns normalized [0,1] strength from the precomputed
+        table of all 169 starting hands (see _preflop_formula).
         """
 
-        ranks = "23456789TJQKA"
-        r1 = ranks.index(hole_cards[0][0])
-        r2 = ranks.index(hole_cards[1][0])
+        r1 = _RANK[ord(hole_cards[0][0])]
+        r2 = _RANK[ord(hole_cards[1][0])]
         suited = hole_cards[0][1] == hole_cards[1][1]
 
-        high = max(r1, r2)
-        low = min(r1, r2)
-
-        # Pair
-        if r1 == r2:
-            return 0.6 + (high / 12) * 0.4
-
-        strength = (high / 12) * 0.6 + (low / 12) * 0.2
+        return _PREFLOP[_preflop_key(r1, r2, suited)]
 
-        if suited:
-            strength += 0.05
+    @classmethod
+    def evaluate_preflop_strength_batch(cls, hands: List[List[str]]) -> List[float]:
+        """
+        Preflop strength of many hole-card pairs in one pass.
 
-        if abs(r1 - r2) == 1:
-            strength += 0.05
+        Meant for simulation/tuning drivers; a single decision still
+        goes through _evaluate_preflop_strength.
+        """
 
-        return min(strength, 1.0)
+        rank = _RANK
+        table = _PREFLOP
+        key = _preflop_key
+        return [
+            table[key(rank[ord(c1[0])], rank[ord(c2[0])], c1[1] == c2[1])]
+            for c1, c2 in hands
+        ]
 
     def _evaluate_postflop_strength(self, hole_cards: List[str], board: List[str]) -> float:
         """
@@ -303,39 +389,10 @@ class ChatgptAgent(BasePokerAgent):
         - Strong draws
         """
 
-        ranks = "23456789TJQKA"
-        values = [ranks.index(c[0]) for c in hole_cards + board]
-        counts = {v: values.count(v) for v in values}
-
-        max_count = max(counts.values())
-
-        # Trips+
-        if max_count >= 3:
-            return 0.9
-
-        # Two pair
-        pairs = sum(1 for v in counts.values() if v == 2)
-        if pairs >= 2:
-            return 0.8
-
-        # One pair
-        if pairs == 1:
-            return 0.6
-
-        # Flush draw detection
-        suits = [c[1] for c in hole_cards + board]
-        for s in "shdc":
-            if suits.count(s) >= 4:
-                return 0.5
-
-        # Overcards heuristic
-        hole_values = [ranks.index(c[0]) for c in hole_cards]
-        board_values = [ranks.index(c[0]) for c in board]
-        if hole_values and board_values:
-            if max(hole_values) > max(board_values):
-                return 0.45
-
-        return 0.2
+        return _postflop_strength(
+            sum(map(_CARD_LANES.__getitem__, hole_cards)),
+            sum(map(_CARD_LANES.__getitem__, board)),
+        )
 
     # -------------------------- #
     #       OPPONENT MODEL       #
@@ -344,12 +401,27 @@ class ChatgptAgent(BasePokerAgent):
     def hand_ended(self, hand_history: Dict):
         self.hand_counter += 1
 
-        for result in hand_history["player_results"]:
-            pid = result["player_id"]
-            if pid == self.my_id:
+        results = hand_history["player_results"]
+        my_id = self.my_id
+        pid_to_slot = self._pid_to_slot
+        opp_hands = self.opp_hands
+        opp_showdowns = self.opp_showdowns
+
+        for pid, hole_cards in zip(map(_GET_PLAYER_ID, results), map(_GET_HOLE_CARDS, results)):
+            if pid == my_id:
                 continue
 
-            if pid in self.opponent_stats:
-                self.opponent_stats[pid]["hands"] += 1
-                if result["hole_cards"] is not None:
-                    self.opponent_stats[pid]["showdowns"] += 1
+            slot = pid_to_slot.get(pid)
+            if slot is not None:
+                opp_hands[slot] += 1
+                if hole_cards is not None:
+                    opp_showdowns[slot] += 1
+
+
+# Stack-depth ladder: effective_bb <= 15 short, <= 30 mid, otherwise deep
+_STACK_LIMITS = (15, 30)
+_STACK_STRATEGIES = (
+    ChatgptAgent._short_stack_strategy,
+    ChatgptAgent._mid_stack_strategy,
+    ChatgptAgent._deep_stack_strategy,
+)
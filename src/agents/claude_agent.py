@@ -12,7 +12,9 @@ Strategy pillars:
 
 from .base_agent import BasePokerAgent
 from collections import Counter, defaultdict
-from itertools import combinations
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import combinations, combinations_with_replacement
 from typing import List, Tuple, Optional, Dict, Any
 import math
 
@@ -20,21 +22,23 @@ import math
 RANKS  = '23456789TJQKA'
 RANK_VAL = {r: i for i, r in enumerate(RANKS)}   # '2'=0 … 'A'=12
 
-def _rank(c: str) -> int: return RANK_VAL[c[0]]
-def _suit(c: str) -> str: return c[1]
+SUITS  = 'shdc'
+
+# Cards are parsed once per decision (see decide_action) into small ints:
+# bits 0-3 = rank, bits 4-5 = suit. Every helper below takes these.
+_CARD8 = {r + s: RANK_VAL[r] | (i << 4) for i, s in enumerate(SUITS) for r in RANKS}
+
+def _rank(c: int) -> int: return c & 0xF
+def _suit(c: int) -> int: return c >> 4
 
 
 # ─── 5-card hand evaluator ────────────────────────────────────────────────────
-def _score5(cards: List[str]) -> tuple:
+def _hand_tuple(ranks: List[int], flush: bool) -> tuple:
     """
-    Return a comparable tuple for a 5-card hand.
+    Return a comparable tuple for 5 ranks sorted high to low.
     Higher tuple == stronger hand.
     (8) = straight-flush … (0) = high-card
     """
-    ranks  = sorted([_rank(c) for c in cards], reverse=True)
-    suits  = [_suit(c) for c in cards]
-    flush  = len(set(suits)) == 1
-
     cnt    = Counter(ranks)
     groups = sorted(cnt.items(), key=lambda x: (x[1], x[0]), reverse=True)
     g_cnt  = [g[1] for g in groups]
@@ -59,12 +63,102 @@ def _score5(cards: List[str]) -> tuple:
     return (0,) + tuple(ranks)
 
 
-def best_hand_rank(hole: List[str], board: List[str]) -> Optional[tuple]:
-    """Best 5-card hand score from hole + board cards."""
-    all_cards = hole + board
-    if len(all_cards) < 5:
+# Cactus-Kev rank primes: a rank multiset is identified by its product
+_PRIMES   = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _pack(hand: tuple) -> int:
+    """
+    Pack a _hand_tuple into one int: category << 20, then up to five ranks
+    in 4-bit fields from bit 16 down. Packed ints order exactly like the
+    tuples, and score >> 20 / (score >> 16) & 0xF read back category / top rank.
+    """
+    packed = hand[0] << 20
+    for i, r in enumerate(hand[1:]):
+        packed |= r << (16 - 4 * i)
+    return packed
+
+
+def _build_tables() -> Tuple[Dict[int, int], Dict[int, int], List[Optional[int]]]:
+    """
+    Enumerate every 5-card equivalence class with _hand_tuple and number them
+    1 (royal flush) … 7462 (7-5-4-3-2 offsuit).
+
+    Returns (flush table keyed by the 13-bit rank mask, unsuited table keyed by
+    the product of rank primes, class number -> packed hand score).
+    """
+    flush_hands, unsuited_hands = {}, {}
+    for combo in combinations_with_replacement(range(12, -1, -1), 5):
+        if max(Counter(combo).values()) > 4:
+            continue
+        ranks = list(combo)
+        unsuited_hands[math.prod(_PRIMES[r] for r in ranks)] = _hand_tuple(ranks, False)
+        if len(set(ranks)) == 5:
+            flush_hands[sum(1 << r for r in ranks)] = _hand_tuple(ranks, True)
+
+    classes = sorted(set(flush_hands.values()) | set(unsuited_hands.values()), reverse=True)
+    number  = {t: i for i, t in enumerate(classes, 1)}
+    return (
+        {k: number[t] for k, t in flush_hands.items()},
+        {k: number[t] for k, t in unsuited_hands.items()},
+        [None] + [_pack(t) for t in classes],
+    )
+
+FLUSH_LUT, UNSUITED_LUT, HAND_CLASS = _build_tables()
+
+
+def _extend_tables(n: int) -> None:
+    """
+    Add n-card entries (n = 6, 7) to both tables, each holding the best
+    5-card rank among its (n-1)-card subsets.
+
+    Distinct rank multisets have distinct prime products and distinct rank
+    sets have distinct masks, so 5-, 6- and 7-card keys share the same
+    tables without collisions.
+    """
+    for combo in combinations_with_replacement(range(13), n):
+        if max(Counter(combo).values()) > 4:
+            continue
+        prod = math.prod(_PRIMES[r] for r in combo)
+        UNSUITED_LUT[prod] = min(UNSUITED_LUT[prod // _PRIMES[r]] for r in set(combo))
+    for combo in combinations(range(13), n):
+        mask = sum(1 << r for r in combo)
+        FLUSH_LUT[mask] = min(FLUSH_LUT[mask & ~(1 << r)] for r in combo)
+
+_extend_tables(6)
+_extend_tables(7)
+
+
+@lru_cache(maxsize=4096)
+def _best_rank(cards: Tuple[int, ...]) -> Optional[int]:
+    """
+    Best (lowest) Cactus-Kev rank of 5-7 cards: 1 (best) … 7462 (worst).
+    HAND_CLASS[rank] gives the packed hand score (see _pack).
+
+    The whole hand is scored with one lookup: by the suit's rank mask when
+    a flush is on, otherwise by the product of rank primes. No 5-card
+    combinations are walked.
+    """
+    if len(cards) < 5:
         return None
-    return max(_score5(list(f)) for f in combinations(all_cards, 5))
+
+    suit_masks = [0] * 4
+    for c in cards:
+        suit_masks[c >> 4] |= 1 << (c & 0xF)
+    for mask in suit_masks:
+        if mask.bit_count() >= 5:
+            # 5+ cards of one suit out of at most 7 leave no room for quads
+            # or a full house, so the best flush is the best hand outright.
+            return FLUSH_LUT[mask]
+    return UNSUITED_LUT[math.prod(_PRIMES[c & 0xF] for c in cards)]
+
+
+def best_hand_rank(hole: List[int], board: List[int]) -> Optional[int]:
+    """
+    Best (lowest) 5-card Cactus-Kev rank from hole + board cards.
+    Memoized on the card set, so repeat decisions on a street are free.
+    """
+    return _best_rank(tuple(sorted(hole + board)))
 
 
 # ─── Preflop strength (Chen formula) ─────────────────────────────────────────
@@ -73,7 +167,7 @@ _CHEN_HIGH = {
     7: 4, 6: 3.5, 5: 3, 4: 2.5, 3: 2, 2: 1.5, 1: 1, 0: 1
 }
 
-def preflop_strength(hole: List[str]) -> float:
+def preflop_strength(hole: List[int]) -> float:
     """
     Chen-formula score for two hole cards.
     Approximate ranges:
@@ -86,11 +180,15 @@ def preflop_strength(hole: List[str]) -> float:
       >=  7 : 88, KJs, AJo, KQo
       >=  5 : 77–22, suited connectors, broadways
     """
-    r1, r2 = _rank(hole[0]), _rank(hole[1])
-    suited = _suit(hole[0]) == _suit(hole[1])
-    hi, lo = max(r1, r2), min(r1, r2)
+    r1, r2 = hole[0] & 0xF, hole[1] & 0xF
+    suited = (hole[0] ^ hole[1]) < 0x10
+    hi, lo = (r1, r2) if r1 >= r2 else (r2, r1)
+    return _PREFLOP_TABLE[hi * 13 + lo + 169 * suited]
+
 
-    if r1 == r2:
+def _preflop_strength_canon(hi: int, lo: int, suited: bool) -> float:
+    """Chen score of a canonical (high rank, low rank, suited) starting hand."""
+    if hi == lo:
         return max(_CHEN_HIGH[hi] * 2, 5)
 
     score = _CHEN_HIGH[hi]
@@ -113,8 +211,17 @@ def preflop_strength(hole: List[str]) -> float:
     return score
 
 
+# Chen score of every (hi, lo, suited) key, indexed hi*13 + lo + 169*suited
+_PREFLOP_TABLE = tuple(
+    _preflop_strength_canon(hi, lo, suited)
+    for suited in (False, True) for hi in range(13) for lo in range(13)
+)
+
+
 # ─── Draw detection ───────────────────────────────────────────────────────────
-def detect_draws(hole: List[str], board: List[str]) -> Dict[str, bool]:
+_WHEEL_MASK = (1 << 12) | 0xF        # A-2-3-4-5
+
+def detect_draws(hole: List[int], board: List[int]) -> Dict[str, bool]:
     """
     Detect flush draw, open-ended straight draw, and gutshot
     in the combined hole + board cards.
@@ -122,51 +229,54 @@ def detect_draws(hole: List[str], board: List[str]) -> Dict[str, bool]:
     if len(board) < 3:
         return {"fd": False, "oesd": False, "gs": False}
 
-    all_cards  = hole + board
-    suit_cnt   = Counter(_suit(c) for c in all_cards)
-    rank_set   = set(_rank(c) for c in all_cards)
+    # 13-bit rank masks: one over all cards, one per suit
+    rank_mask  = 0
+    suit_masks = [0] * 4
+    for c in hole + board:
+        bit = 1 << (c & 0xF)
+        rank_mask |= bit
+        suit_masks[c >> 4] |= bit
 
     # Flush draw: exactly 4 of a suit (5 = already made)
-    fd = any(v == 4 for v in suit_cnt.values())
+    fd = any(m.bit_count() == 4 for m in suit_masks)
 
     # Straight draws: scan all possible 5-rank windows
     oesd = False
     gs   = False
     for low in range(0, 10):           # 2-low through T-low straights
-        window = set(range(low, low + 5))
-        have   = rank_set & window
-        miss   = window - rank_set
-        if len(have) == 4 and len(miss) == 1:
-            m = next(iter(miss))
-            if m == low or m == low + 4:
+        miss = (0x1F << low) & ~rank_mask
+        if miss.bit_count() == 1:      # exactly one rank missing
+            if miss == 1 << low or miss == 1 << (low + 4):
                 oesd = True            # open-ended: missing an end card
             else:
                 gs   = True            # gutshot: missing a middle card
     # Ace-low (wheel) gutshot
-    wheel = {12, 0, 1, 2, 3}
-    have_w = rank_set & wheel
-    miss_w = wheel - rank_set
-    if len(have_w) == 4 and len(miss_w) == 1:
+    miss = _WHEEL_MASK & ~rank_mask
+    if miss.bit_count() == 1:
         gs = True
 
     return {"fd": fd, "oesd": oesd, "gs": gs}
 
 
 # ─── Board texture ────────────────────────────────────────────────────────────
-def board_wetness(board: List[str]) -> int:
+def board_wetness(board: List[int]) -> int:
     """
     Rough wetness score (0 = very dry, higher = many draws present).
     Used to adjust postflop caution.
     """
     if len(board) < 3:
         return 0
-    suits = [_suit(c) for c in board]
-    ranks = sorted([_rank(c) for c in board])
+    ranks    = []
+    suit_cnt = [0] * 4
+    for c in board:
+        ranks.append(c & 0xF)
+        suit_cnt[c >> 4] += 1
+    ranks.sort()
     wet   = 0
 
-    suit_cnt = Counter(suits)
-    if max(suit_cnt.values()) >= 2: wet += 1
-    if max(suit_cnt.values()) >= 3: wet += 3   # monotone board is very wet
+    max_suit = max(suit_cnt)
+    if max_suit >= 2: wet += 1
+    if max_suit >= 3: wet += 3   # monotone board is very wet
 
     gaps = [ranks[i+1] - ranks[i] for i in range(len(ranks) - 1)]
     if min(gaps) == 1: wet += 2    # at least two connected board cards
@@ -187,27 +297,48 @@ class OpponentModel:
         self.agg_calls      = 0   # Passive actions (call)
         self.showdowns      = 0
         self.showdown_wins  = 0
+        self.refresh()
 
-    @property
-    def vpip_rate(self) -> float:
-        return self.vpip / max(self.hands_seen, 1)
-
-    @property
-    def pfr_rate(self) -> float:
-        return self.pfr / max(self.hands_seen, 1)
-
-    @property
-    def aggression_factor(self) -> float:
-        """AF = bets+raises / calls. >2 = aggressive, <1 = passive."""
-        return self.agg_bets / max(self.agg_calls, 1)
-
-    def is_tight(self) -> bool:   return self.vpip_rate < 0.25
-    def is_loose(self) -> bool:   return self.vpip_rate > 0.45
-    def is_passive(self) -> bool: return self.aggression_factor < 1.2
-
-    def limp_fest(self) -> bool:
-        """Plays lots of hands but doesn't raise (limper)."""
-        return self.is_loose() and self.pfr_rate < 0.10
+    def refresh(self):
+        """
+        Recompute the cached rates and archetype flags from the counters.
+        Called once per hand from hand_ended, so readers pay no arithmetic.
+        """
+        hands = max(self.hands_seen, 1)
+        self.vpip_rate = self.vpip / hands
+        self.pfr_rate  = self.pfr / hands
+        # AF = bets+raises / calls. >2 = aggressive, <1 = passive.
+        self.aggression_factor = self.agg_bets / max(self.agg_calls, 1)
+
+        self.is_tight   = self.vpip_rate < 0.25
+        self.is_loose   = self.vpip_rate > 0.45
+        self.is_passive = self.aggression_factor < 1.2
+        # Plays lots of hands but doesn't raise (limper)
+        self.limp_fest  = self.is_loose and self.pfr_rate < 0.10
+
+
+# ─── Decision context ─────────────────────────────────────────────────────────
+@dataclass(slots=True)
+class Ctx:
+    """Everything one decision reads from game_state, gathered once."""
+    stage:        str
+    hole:         List[int]
+    board:        List[int]
+    bb:           int
+    ante:         int
+    my_stack:     int
+    my_pos:       int
+    can_raise:    bool
+    cost:         int
+    min_cost:     int
+    bet_to_match: int
+    n_players:    int
+    n_active:     int
+    total_pot:    int
+    m_ratio:      float
+    is_late:      bool
+    is_early:     bool
+    hand_log:     List[dict]
 
 
 # ─── Main agent ───────────────────────────────────────────────────────────────
@@ -225,39 +356,76 @@ class ClaudeAgent(BasePokerAgent):
         self.player_count: int             = 8
         self.level_one_bb: int             = 20
 
+        # Per-hand action tallies, fed incrementally by _observe_actions
+        self._log_seen: int                = 0
+        self._preflop_vpip: set            = set()
+        self._preflop_raisers: set         = set()
+
+        # Seat constants for the current hand, see _cache_seat
+        self._seat_hand_id: Optional[int]  = None
+
     # ── Lifecycle hooks ────────────────────────────────────────────────────────
     def game_start(self, start_state: dict):
         self.my_id         = start_state["your_status"]["player_id"]
         self.initial_stack = start_state["initial_stack_per_player"]
         self.player_count  = start_state["player_count"]
         self.level_one_bb  = start_state["level_one_big_blind"]
+        self._seat_hand_id = None
         for p in start_state["players"]:
             if p["player_id"] != self.my_id:
                 self.opponents[p["player_id"]] = OpponentModel(p["player_id"])
 
     def hand_ended(self, hand_history: dict):
         """Update opponent models from revealed information."""
-        log = hand_history.get("hand_log", [])
+        _best_rank.cache_clear()   # scores are only reused within a hand
 
-        preflop_vpip: set  = set()
-        preflop_raisers: set = set()
+        # Actions after our last decision (the rest were seen in decide_action)
+        self._observe_actions(hand_history.get("hand_log", []))
 
-        for entry in log:
+        for opp in self.opponents.values():
+            opp.hands_seen += 1
+            if opp.player_id in self._preflop_vpip:
+                opp.vpip += 1
+            if opp.player_id in self._preflop_raisers:
+                opp.pfr += 1
+            opp.refresh()
+
+        self._log_seen = 0
+        self._preflop_vpip.clear()
+        self._preflop_raisers.clear()
+
+        # Showdown data
+        for result in hand_history.get("player_results", []):
+            pid = result["player_id"]
+            if pid == self.my_id or pid not in self.opponents:
+                continue
+            opp = self.opponents[pid]
+            if result.get("hole_cards") and result["hand_status"] in ("active", "all-in"):
+                opp.showdowns += 1
+                if result.get("winnings", 0) > 0:
+                    opp.showdown_wins += 1
+
+    def _observe_actions(self, log: list):
+        """
+        Fold hand_log entries not seen yet this hand into the opponent models.
+        Called on every decision, so each entry is processed exactly once.
+        """
+        for entry in log[self._log_seen:]:
             pid    = entry["player_id"]
             if pid == self.my_id:
                 continue
-            if pid not in self.opponents:
-                self.opponents[pid] = OpponentModel(pid)
+            opp    = self.opponents.get(pid)
+            if opp is None:
+                opp = self.opponents[pid] = OpponentModel(pid)
 
-            opp    = self.opponents[pid]
             action = entry["action"]
-            stage  = entry.get("stage", "")
+            stage  = entry["stage"]
 
             if stage == "pre-flop":
                 if action in ("call", "raise", "bet", "all-in"):
-                    preflop_vpip.add(pid)
+                    self._preflop_vpip.add(pid)
                 if action in ("raise", "bet", "all-in"):
-                    preflop_raisers.add(pid)
+                    self._preflop_raisers.add(pid)
                     opp.agg_bets += 1
                 elif action == "call":
                     opp.agg_calls += 1
@@ -267,33 +435,15 @@ class ClaudeAgent(BasePokerAgent):
                     opp.agg_bets += 1
                 elif action == "call":
                     opp.agg_calls += 1
-
-        for opp in self.opponents.values():
-            opp.hands_seen += 1
-            if opp.player_id in preflop_vpip:
-                opp.vpip += 1
-            if opp.player_id in preflop_raisers:
-                opp.pfr += 1
-
-        # Showdown data
-        for result in hand_history.get("player_results", []):
-            pid = result["player_id"]
-            if pid == self.my_id or pid not in self.opponents:
-                continue
-            opp = self.opponents[pid]
-            if result.get("hole_cards") and result["hand_status"] in ("active", "all-in"):
-                opp.showdowns += 1
-                if result.get("winnings", 0) > 0:
-                    opp.showdown_wins += 1
+        self._log_seen = len(log)
 
     # ── Main decision ──────────────────────────────────────────────────────────
     def decide_action(self, game_state: dict) -> dict:
         stage          = game_state["current_stage"]
-        hole           = game_state["hole_cards"]
-        board          = game_state["community_cards"]
+        hole           = [_CARD8[c] for c in game_state["hole_cards"]]
+        board          = [_CARD8[c] for c in game_state["community_cards"]]
         bb             = game_state["big_blind"]
         ante           = game_state.get("ante", 0)
-        small_blind    = game_state["small_blind"]
         my_status      = game_state["your_status"]
         my_stack       = my_status["stack"]
         my_pos         = my_status["position"]
@@ -303,57 +453,73 @@ class ClaudeAgent(BasePokerAgent):
         bet_to_match   = game_state["bet_to_match"]
         players        = game_state["players"]
 
-        n_players  = len(players)
+        # Seat and blind structure are fixed for the hand: derive them once
+        if game_state["hand_id"] != self._seat_hand_id:
+            self._cache_seat(game_state)
+        n_players  = self._n_players
         n_active   = sum(1 for p in players if p["hand_status"] == "active")
         total_pot  = sum(pot["amount"] for pot in game_state["pots"])
 
         # M-ratio: how many orbits of blinds our stack can survive
-        orbit_cost = small_blind + bb + ante * n_players
-        m_ratio    = my_stack / max(orbit_cost, 1)
+        m_ratio    = my_stack / self._orbit_cost
 
-        # Position: Dealer=0, SB=1, BB=2, UTG=3, …
-        # Preflop late = dealer, SB, BB (they act last vs. limpers/raisers)
-        # Postflop late = dealer (pos 0) acts last
         if stage == "pre-flop":
-            is_late  = my_pos == 0 or my_pos >= n_players - 2
-            is_early = 3 <= my_pos <= max(3, n_players // 2)
+            is_late, is_early = self._seat_preflop
         else:
-            is_late  = (my_pos == 0)
-            is_early = my_pos in (1, 2)
+            is_late, is_early = self._seat_postflop
 
         # Count callers/raisers ahead of us this street for table dynamics
         hand_log = game_state["hand_log"]
+        self._observe_actions(hand_log)
+
+        ctx = Ctx(
+            stage, hole, board, bb, ante, my_stack, my_pos, can_raise,
+            cost_to_match, min_cost, bet_to_match, n_players, n_active,
+            total_pot, m_ratio, is_late, is_early, hand_log,
+        )
 
         if stage == "pre-flop":
-            return self._preflop(
-                hole, bb, my_stack, my_pos, n_players, n_active,
-                cost_to_match, min_cost, bet_to_match, can_raise,
-                m_ratio, is_late, is_early, total_pot, hand_log
-            )
+            return self._preflop(ctx)
         else:
-            return self._postflop(
-                hole, board, bb, my_stack, my_pos, n_players, n_active,
-                cost_to_match, min_cost, bet_to_match, can_raise,
-                m_ratio, is_late, is_early, stage, total_pot, hand_log
-            )
+            return self._postflop(ctx)
+
+    def _cache_seat(self, game_state: dict):
+        """Per-hand constants: player count, orbit cost and seat class per street."""
+        n_players = len(game_state["players"])
+        my_pos    = game_state["your_status"]["position"]
+        orbit_cost = (game_state["small_blind"] + game_state["big_blind"]
+                      + game_state.get("ante", 0) * n_players)
+
+        self._seat_hand_id = game_state["hand_id"]
+        self._n_players    = n_players
+        self._orbit_cost   = max(orbit_cost, 1)
+
+        # Position: Dealer=0, SB=1, BB=2, UTG=3, …
+        # Preflop late = dealer, SB, BB (they act last vs. limpers/raisers)
+        # Postflop late = dealer (pos 0) acts last
+        self._seat_preflop  = (my_pos == 0 or my_pos >= n_players - 2,
+                               3 <= my_pos <= max(3, n_players // 2))
+        self._seat_postflop = (my_pos == 0, my_pos in (1, 2))
 
     # ── Preflop strategy ───────────────────────────────────────────────────────
-    def _preflop(
-        self, hole, bb, my_stack, my_pos, n_players, n_active,
-        cost, min_cost, bet_to_match, can_raise,
-        m, is_late, is_early, pot, hand_log
-    ) -> dict:
+    def _preflop(self, ctx: Ctx) -> dict:
+        hole, bb, my_stack, my_pos = ctx.hole, ctx.bb, ctx.my_stack, ctx.my_pos
+        cost, min_cost, bet_to_match = ctx.cost, ctx.min_cost, ctx.bet_to_match
+        can_raise, n_active, pot, m = ctx.can_raise, ctx.n_active, ctx.total_pot, ctx.m_ratio
+        is_late, is_early, hand_log = ctx.is_late, ctx.is_early, ctx.hand_log
 
         strength = preflop_strength(hole)
 
         # Count preflop raises by opponents
-        pf_actions = [e for e in hand_log
-                      if e.get("stage") == "pre-flop"
-                      and e["player_id"] != self.my_id]
-        n_raisers = sum(1 for e in pf_actions
-                        if e["action"] in ("raise", "bet", "all-in"))
-        n_callers = sum(1 for e in pf_actions
-                        if e["action"] == "call")
+        n_raisers = n_callers = 0
+        for e in hand_log:
+            if e["stage"] != "pre-flop" or e["player_id"] == self.my_id:
+                continue
+            action = e["action"]
+            if action in ("raise", "bet", "all-in"):
+                n_raisers += 1
+            elif action == "call":
+                n_callers += 1
 
         facing_raise    = cost > bb * 1.5
         facing_3bet_plus = n_raisers >= 2
@@ -471,20 +637,26 @@ class ClaudeAgent(BasePokerAgent):
         return {"action": "fold"}
 
     # ── Postflop strategy ──────────────────────────────────────────────────────
-    def _postflop(
-        self, hole, board, bb, my_stack, my_pos, n_players, n_active,
-        cost, min_cost, bet_to_match, can_raise,
-        m, is_late, is_early, stage, pot, hand_log
-    ) -> dict:
-
-        score  = best_hand_rank(hole, board)
-        cat    = score[0] if score else -1    # 0=high card … 8=str-flush
+    def _postflop(self, ctx: Ctx) -> dict:
+        stage, hole, board, my_stack = ctx.stage, ctx.hole, ctx.board, ctx.my_stack
+        cost, min_cost, bet_to_match = ctx.cost, ctx.min_cost, ctx.bet_to_match
+        can_raise, n_active, pot, is_late = ctx.can_raise, ctx.n_active, ctx.total_pot, ctx.is_late
+        hand_log = ctx.hand_log
+
+        rank   = best_hand_rank(hole, board)
+        score  = HAND_CLASS[rank] if rank else None
+        cat    = score >> 20 if score else -1    # 0=high card … 8=str-flush
         draws  = detect_draws(hole, board)
         wet    = board_wetness(board)
 
-        top_pair  = self._is_top_pair(hole, board, score)
-        overpair  = self._is_overpair(hole, board, score)
-        good_kicker = self._has_good_kicker(hole, board, score)
+        # Card facts shared by the pair helpers, computed once
+        hole_ranks = [_rank(c) for c in hole]
+        top_board  = max(_rank(c) for c in board) if board else None
+        pair_rank  = (score >> 16) & 0xF if cat == 1 else None
+
+        top_pair  = self._is_top_pair(hole_ranks, top_board, pair_rank)
+        overpair  = self._is_overpair(hole_ranks, top_board, pair_rank)
+        good_kicker = self._has_good_kicker(hole_ranks, pair_rank)
 
         # Pot odds as a fraction of call vs pot
         pot_odds = cost / max(pot + cost, 1) if cost > 0 else 0
@@ -513,7 +685,6 @@ class ClaudeAgent(BasePokerAgent):
 
         # One pair
         if cat == 1:
-            pair_rank = score[1]
             if overpair:
                 # Overpair: strong but wet boards are dangerous
                 if wet >= 4 and cost > pot * 0.8:
@@ -641,30 +812,26 @@ class ClaudeAgent(BasePokerAgent):
                     return {"action": "increase", "amount": bet_amount}
             return {"action": "match"}   # check if can't raise
 
-    def _is_top_pair(self, hole, board, score) -> bool:
-        if not score or score[0] != 1 or not board:
+    # pair_rank is None unless the made hand is exactly one pair;
+    # top_board is None when there is no board.
+    def _is_top_pair(self, hole_ranks, top_board, pair_rank) -> bool:
+        if pair_rank is None or top_board is None:
             return False
-        top_board = max(_rank(c) for c in board)
-        pair_rank  = score[1]
-        hole_ranks = [_rank(c) for c in hole]
         return pair_rank == top_board and pair_rank in hole_ranks
 
-    def _is_overpair(self, hole, board, score) -> bool:
-        if not score or score[0] != 1 or not board:
+    def _is_overpair(self, hole_ranks, top_board, pair_rank) -> bool:
+        if pair_rank is None or top_board is None:
             return False
-        hr = [_rank(c) for c in hole]
-        if hr[0] != hr[1]:
+        if hole_ranks[0] != hole_ranks[1]:
             return False
-        return hr[0] > max(_rank(c) for c in board)
+        return hole_ranks[0] > top_board
 
-    def _has_good_kicker(self, hole, board, score) -> bool:
+    def _has_good_kicker(self, hole_ranks, pair_rank) -> bool:
         """
         Consider kicker 'good' if our non-pair card is T or higher.
         """
-        if not score or score[0] != 1:
+        if pair_rank is None:
             return False
-        pair_rank  = score[1]
-        hole_ranks = [_rank(c) for c in hole]
         kicker = [r for r in hole_ranks if r != pair_rank]
         return bool(kicker) and kicker[0] >= 8   # T = index 8
 
@@ -1,13 +1,258 @@
 from .base_agent import BasePokerAgent
 import collections
-import math
+import functools
+import itertools
+import types
+from dataclasses import dataclass
+
+# Cactus-Kev card encoding: one int per card,
+#   bits 16-28: rank bit, 12-15: suit bit, 8-11: rank index, 0-7: rank prime
+_RANKS = "23456789TJQKA"
+_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+_SUIT_BITS = {"s": 1, "h": 2, "d": 4, "c": 8}
+# Rank (2-14) of a card's rank character, indexed by ord()
+_RANK_LUT = bytes(_RANKS.index(chr(i)) + 2 if chr(i) in _RANKS else 0 for i in range(256))
+SUIT_IDX = {"s": 0, "h": 1, "c": 2, "d": 3}
+_CARD_INTS = {
+    r + s: (1 << (16 + i)) | (bit << 12) | (i << 8) | _PRIMES[i]
+    for i, r in enumerate(_RANKS) for s, bit in _SUIT_BITS.items()
+}
+
+def _five_card_hand(ranks, flush):
+    # (category, tiebreakers) of a 5-card hand, ranks sorted high to low,
+    # in the same shape evaluate_hand has always returned
+    count = collections.Counter(ranks)
+    groups = sorted(count, key=lambda r: (count[r], r), reverse=True)
+    shape = [count[r] for r in groups]
+    straight_high = 0
+    if len(groups) == 5:
+        if ranks[0] - ranks[4] == 4:
+            straight_high = ranks[0]
+        elif ranks == (14, 5, 4, 3, 2):
+            straight_high = 5
+    if straight_high and flush:
+        return (8, straight_high)
+    if shape[0] == 4:
+        return (7, groups[0], groups[1])
+    if shape == [3, 2]:
+        return (6, groups[0], groups[1])
+    if flush:
+        return (5, ranks)
+    if straight_high:
+        return (4, straight_high)
+    if shape[0] == 3:
+        return (3, groups[0], tuple(groups[1:]))
+    if shape[:2] == [2, 2]:
+        return (2, tuple(groups[:2]), groups[2])
+    if shape[0] == 2:
+        return (1, groups[0], tuple(groups[1:]))
+    return (0, ranks)
+
+def _build_lookup_tables():
+    # Every distinct 5-card hand ranked 1 (royal flush) .. 7462 (7-5-4-3-2),
+    # keyed by prime product (no flush) and by OR of rank bits (flush)
+    unsuited, flush = {}, {}
+    for ranks in itertools.combinations_with_replacement(range(14, 1, -1), 5):
+        if max(ranks.count(r) for r in ranks) > 4:
+            continue
+        key = 1
+        for r in ranks:
+            key *= _PRIMES[r - 2]
+        unsuited[key] = _five_card_hand(ranks, False)
+        if len(set(ranks)) == 5:
+            flush[sum(1 << (r - 2) for r in ranks)] = _five_card_hand(ranks, True)
+    hands = sorted(set(unsuited.values()) | set(flush.values()), reverse=True)
+    rank_of = {hand: i for i, hand in enumerate(hands, 1)}
+    flush_lut = {key: rank_of[hand] for key, hand in flush.items()}
+    unsuited_lut = {key: rank_of[hand] for key, hand in unsuited.items()}
+    return flush_lut, unsuited_lut, [None] + hands
+
+FLUSH_LUT, UNSUITED_LUT, HAND_BY_RANK = _build_lookup_tables()
+
+def _preflop_strength(hi, lo, suited):
+    # Heuristic strength score 0-1 for preflop hands (higher = better)
+    ranks = [hi, lo]
+    if ranks[0] == ranks[1]:  # Pairs
+        return 0.6 + (ranks[0] - 2) / 12 * 0.4  # 22: 0.6, AA: 1.0
+    base = (ranks[0] + ranks[1] - 4) / 24 * 0.4  # Scale sum
+    if suited:
+        base += 0.2
+    if abs(ranks[0] - ranks[1]) <= 2:
+        base += 0.1
+    if min(ranks) >= 10:
+        base += 0.1
+    if ranks[0] == 14:
+        base += 0.1
+    return min(base, 1.0)
+
+# All 169 starting hands, keyed by (high rank, low rank, suited)
+PREFLOP_STRENGTH = {
+    (hi, lo, suited): _preflop_strength(hi, lo, suited)
+    for hi in range(2, 15) for lo in range(2, hi + 1)
+    for suited in ((False,) if hi == lo else (False, True))
+}
+
+# Rank bits (bit r for rank r) of A-2-3-4-5
+WHEEL_BITS = (1 << 14) | 0b111100
+
+def _board_has_straight_texture(bits):
+    # Four or more board ranks inside any five-rank window (wheel included)
+    if (bits & WHEEL_BITS).bit_count() >= 4:
+        return True
+    return any(((bits >> low) & 0x1F).bit_count() >= 4 for low in range(2, 11))
+
+def _clamp_bet(size, floor, cap):
+    # Round a chip size up to a whole chip, at least floor and at most cap;
+    # float floor division is exact, so this matches math.ceil
+    amount = -int(-size // 1)
+    if amount < floor:
+        amount = floor
+    if amount > cap:
+        amount = cap
+    return amount
+
+def _best_rank(card_ints):
+    # Cactus-Kev lookup over every 5-card subset; 1 is the best hand
+    best = len(HAND_BY_RANK)
+    for c0, c1, c2, c3, c4 in itertools.combinations(card_ints, 5):
+        if c0 & c1 & c2 & c3 & c4 & 0xF000:
+            rank = FLUSH_LUT[(c0 | c1 | c2 | c3 | c4) >> 16]
+        else:
+            rank = UNSUITED_LUT[(c0 & 0xFF) * (c1 & 0xFF) * (c2 & 0xFF) * (c3 & 0xFF) * (c4 & 0xFF)]
+        if rank < best:
+            best = rank
+    return best
+
+@functools.lru_cache(maxsize=4096)
+def _best_hand(card_ints):
+    # Memoized since a hand is re-evaluated on each decision of a street
+    # (cleared in hand_ended)
+    return HAND_BY_RANK[_best_rank(card_ints)]
+
+def _evaluate_hands_batch(hands):
+    # (category, tiebreakers) for many hands of Cactus-Kev ints (see _CARD_INTS),
+    # for simulation/tuning drivers; bypasses the per-decision cache
+    return [HAND_BY_RANK[_best_rank(h)] for h in hands]
+
+def _position_category(my_position, num_active):
+    # Categorize position for range adjustment
+    if num_active <= 2:
+        return "heads_up"
+    co = (num_active - 1) % num_active
+    hj = (num_active - 2) % num_active
+    if my_position == 0:
+        return "button"
+    if my_position == co:
+        return "cutoff"
+    if my_position == hj:
+        return "hijack"
+    if my_position == 1:
+        return "small_blind"
+    if my_position == 2:
+        return "big_blind"
+    return "early" if my_position >= 3 and my_position < num_active // 2 + 3 else "middle"
+
+# Position category by number of active players (0-10) and seat (0-9)
+POSITION_CATEGORY = [[_position_category(pos, n) for pos in range(10)] for n in range(11)]
+
+# Threshold for opening unraised pots (lower = wider range)
+OPEN_THRESHOLDS = {
+    "early": 0.65,
+    "middle": 0.55,
+    "hijack": 0.45,
+    "cutoff": 0.35,
+    "button": 0.25,
+    "small_blind": 0.3,
+    "big_blind": 0.0,  # Check
+    "heads_up": 0.2
+}
+
+# Categories that 3bet tighter (out of position) / call raises wider
+OOP_CATEGORIES = frozenset(("early", "middle", "big_blind"))
+WIDE_CALL_CATEGORIES = frozenset(("button", "cutoff", "big_blind"))
+
+# Opponent model for players with no stats yet
+DEFAULT_MODEL = types.MappingProxyType({"vpip": 0.25, "pfr": 0.15, "af": 2.0})
+
+# Shared read-only replies for the actions that carry no amount
+FOLD = types.MappingProxyType({"action": "fold"})
+MATCH = types.MappingProxyType({"action": "match"})
+
+# Logged actions that put money in voluntarily / aggressively
+VPIP_ACTIONS = frozenset(("call", "bet", "raise", "all-in"))
+PFR_ACTIONS = frozenset(("bet", "raise", "all-in"))
+RAISE_ACTIONS = PFR_ACTIONS
+
+def _last_aggressor(hand_log, stage):
+    # Player id of the last bet/raise this stage, or None; the current
+    # stage's actions are at the end of the log, so scan backwards
+    for a in reversed(hand_log):
+        if a["stage"] != stage:
+            break
+        if a["action"] in RAISE_ACTIONS:
+            return a["player_id"]
+    return None
+
+@dataclass(slots=True)
+class _Ctx:
+    # Per-decision view of game_state, parsed once in decide_action
+    hole: list
+    community: list
+    stage: str
+    big_blind: int
+    ante: int
+    my_pos: int
+    my_stack: int
+    can_raise: bool
+    pot: int
+    bet_to_match: int
+    cost_to_match: int
+    min_cost_to_increase: int
+    pot_odds: float
+    active_players: list
+    num_active: int
+    num_limpers: int
+    hand_log: list
+
+@dataclass(slots=True)
+class _Cards:
+    # Hole + board encoded once for the postflop helpers
+    card_ints: list  # Cactus-Kev ints
+    suit_bits: list  # per-suit rank bitmasks (bit r for rank r), by SUIT_IDX
+    rank_bits: int  # rank bitmask of all cards
+    hole_ranks: list
+    board_ranks: list  # high to low
+    board_bits: int  # rank bitmask of the board only
+    board_suits: int  # distinct suits on the board
+
+def _encode_cards(hole, board):
+    cards = hole + board
+    ranks = [_RANK_LUT[ord(c[0])] for c in cards]
+    suit_bits = [0, 0, 0, 0]
+    rank_bits = 0
+    for c, r in zip(cards, ranks):
+        suit_bits[SUIT_IDX[c[1]]] |= 1 << r
+        rank_bits |= 1 << r
+    board_bits = 0
+    board_suit_mask = 0
+    for c, r in zip(board, ranks[len(hole):]):
+        board_bits |= 1 << r
+        board_suit_mask |= 1 << SUIT_IDX[c[1]]
+    return _Cards(
+        card_ints=[_CARD_INTS[c] for c in cards],
+        suit_bits=suit_bits,
+        rank_bits=rank_bits,
+        hole_ranks=ranks[:len(hole)],
+        board_ranks=sorted(ranks[len(hole):], reverse=True),
+        board_bits=board_bits,
+        board_suits=board_suit_mask.bit_count(),
+    )
 
 class GrokAgent(BasePokerAgent):
     def __init__(self, seed: int = None, name: str = "Grok Agent"):
         super().__init__(seed, name)
         self.opponent_models = {}
         self.total_hands = 0
-        self.rank_map = {'2': 2, '3': 3, '4': 4, '5': 5, '6': 6, '7': 7, '8': 8, '9': 9, 'T': 10, 'J': 11, 'Q': 12, 'K': 13, 'A': 14}
 
     def game_start(self, start_state):
         # Initialize opponent models with default stats
@@ -19,112 +264,125 @@ class GrokAgent(BasePokerAgent):
                 "pfr_count": 0,
                 "bet_raise_count": 0,
                 "call_count": 0,
-                "hands": 0
+                "hands": 0,
+                **DEFAULT_MODEL
             } for p in start_state["players"] if p["player_id"] != self.my_player_id
         }
 
     def hand_ended(self, hand_history):
         # Update total hands and opponent stats based on the hand log
         self.total_hands += 1
-        for pid in list(self.opponent_models.keys()):
-            if any(pr["player_id"] == pid and pr["stack"] > 0 for pr in hand_history["player_results"]):
-                self.opponent_models[pid]["hands"] += 1
-
-        # Parse preflop actions for VPIP and PFR
-        preflop_actions = [a for a in hand_history["hand_log"] if a["stage"] == "pre-flop"]
-        for action in preflop_actions:
-            pid = action["player_id"]
-            if pid == self.my_player_id or pid not in self.opponent_models:
-                continue
-            if action["action"] in ["small-blind", "big-blind", "ante"]:
-                continue
-            if action["action"] in ["call", "bet", "raise", "all-in"]:
-                self.opponent_models[pid]["vpip_count"] += 1
-            if action["action"] in ["bet", "raise", "all-in"]:
-                self.opponent_models[pid]["pfr_count"] += 1
-
-        # Parse postflop actions for aggression factor
-        postflop_actions = [a for a in hand_history["hand_log"] if a["stage"] != "pre-flop" and a["action"] not in ["ante"]]
-        for action in postflop_actions:
-            pid = action["player_id"]
-            if pid == self.my_player_id or pid not in self.opponent_models:
-                continue
-            if action["action"] in ["bet", "raise", "all-in"]:
-                self.opponent_models[pid]["bet_raise_count"] += 1
-            if action["action"] == "call":
-                self.opponent_models[pid]["call_count"] += 1
+        _best_hand.cache_clear()
 
-        # Clean up models for eliminated players
-        self.opponent_models = {pid: model for pid, model in self.opponent_models.items() if any(pr["player_id"] == pid and pr["stack"] > 0 for pr in hand_history["player_results"])}
+        # One pass over the log: VPIP/PFR preflop, aggression factor postflop
+        for action in hand_history["hand_log"]:
+            model = self.opponent_models.get(action["player_id"])  # Never holds our own id
+            if model is None:
+                continue
+            act = action["action"]
+            if action["stage"] == "pre-flop":
+                if act in VPIP_ACTIONS:  # Blinds and antes are neither
+                    model["vpip_count"] += 1
+                if act in PFR_ACTIONS:
+                    model["pfr_count"] += 1
+            elif act in PFR_ACTIONS:
+                model["bet_raise_count"] += 1
+            elif act == "call":
+                model["call_count"] += 1
+
+        # Count the hand for survivors and clean up models for eliminated players
+        alive = {pr["player_id"] for pr in hand_history["player_results"] if pr["stack"] > 0}
+        self.opponent_models = {pid: model for pid, model in self.opponent_models.items() if pid in alive}
+
+        # Stats only change here, so refresh the ratios decisions read
+        for model in self.opponent_models.values():
+            model["hands"] += 1
+            hands = model["hands"]
+            model["vpip"] = model["vpip_count"] / hands if hands > 0 else 0.25
+            model["pfr"] = model["pfr_count"] / hands if hands > 0 else 0.15
+            model["af"] = model["bet_raise_count"] / model["call_count"] if model["call_count"] > 0 else 2.0
 
     def decide_action(self, game_state):
-        # Core decision logic
-        hole = game_state["hole_cards"]
-        community = game_state["community_cards"]
-        stage = game_state["current_stage"]
+        # Core decision logic: parse the state once into a _Ctx shared by all helpers
         my_status = game_state["your_status"]
-        my_stack = my_status["stack"]
-        my_position = my_status["position"]
-        big_blind = game_state["big_blind"]
-        effective_bb = my_stack / big_blind if big_blind > 0 else float('inf')
-        pots = game_state["pots"]
-        pot = sum(p["amount"] for p in pots)
+        stage = game_state["current_stage"]
+        pot = sum(p["amount"] for p in game_state["pots"])
         cost_to_match = game_state["cost_to_match"]
-        min_cost_to_increase = game_state["min_cost_to_increase"]
+        my_pos = my_status["position"]
         bet_to_match = game_state["bet_to_match"]
-        pot_odds = cost_to_match / (pot + cost_to_match) if cost_to_match > 0 else 0
-        players = game_state["players"]
-        active_players = [p for p in players if p["hand_status"] == "active"]
-        num_active = len(active_players)
-        current_log = [a for a in game_state["hand_log"] if a["stage"] == stage]
 
-        # Get opponent models (defaults for unknown)
-        default_model = {"vpip": 0.25, "pfr": 0.15, "af": 2.0}
+        # One pass over the players: active list and limpers before me
+        active_players = []
+        num_limpers = 0
+        for p in game_state["players"]:
+            if p["hand_status"] == "active":
+                active_players.append(p)
+                if p["position"] > 2 and p["position"] < my_pos and p["current_bet_this_stage"] == bet_to_match:
+                    num_limpers += 1
+
+        ctx = _Ctx(
+            hole=game_state["hole_cards"],
+            community=game_state["community_cards"],
+            stage=stage,
+            big_blind=game_state["big_blind"],
+            ante=game_state["ante"],
+            my_pos=my_pos,
+            my_stack=my_status["stack"],
+            can_raise=my_status["can_raise"],
+            pot=pot,
+            bet_to_match=bet_to_match,
+            cost_to_match=cost_to_match,
+            min_cost_to_increase=game_state["min_cost_to_increase"],
+            pot_odds=cost_to_match / (pot + cost_to_match) if cost_to_match > 0 else 0,
+            active_players=active_players,
+            num_active=len(active_players),
+            num_limpers=num_limpers,
+            hand_log=game_state["hand_log"],
+        )
+        effective_bb = ctx.my_stack / ctx.big_blind if ctx.big_blind > 0 else float('inf')
 
         # Short stack adjustment: push/fold mode if effective BB < 10
         if effective_bb < 10:
-            return self.short_stack_logic(game_state, hole, pot, cost_to_match, min_cost_to_increase, my_stack, current_log)
+            return self.short_stack_logic(ctx)
 
         if stage == "pre-flop":
-            return self.preflop_logic(game_state, hole, my_position, num_active, big_blind, bet_to_match, cost_to_match, min_cost_to_increase, my_stack, current_log, pot, default_model)
+            return self.preflop_logic(ctx)
 
         else:
-            return self.postflop_logic(game_state, hole, community, stage, my_position, pot, cost_to_match, min_cost_to_increase, my_stack, current_log, pot_odds, default_model)
+            return self.postflop_logic(ctx)
 
-    def short_stack_logic(self, game_state, hole, pot, cost_to_match, min_cost_to_increase, my_stack, current_log):
+    def short_stack_logic(self, ctx):
         # Push/fold for short stacks: push with top 40% hands if unopened or facing small bet, call all-in if pot odds justify
-        hand_strength = self.get_preflop_hand_strength(hole)
-        is_facing_raise = any(a["action"] in ["raise", "bet", "all-in"] for a in current_log)
-        if cost_to_match == 0:
+        hand_strength = self.get_preflop_hand_strength(ctx.hole)
+        is_facing_raise = _last_aggressor(ctx.hand_log, ctx.stage) is not None
+        if ctx.cost_to_match == 0:
             # Push if good hand
             if hand_strength > 0.4:
-                return {"action": "increase", "amount": my_stack}
+                return {"action": "increase", "amount": ctx.my_stack}
             else:
-                return {"action": "match"}
+                return MATCH
         else:
             # Facing bet: call if good odds or good hand
-            pot_odds = cost_to_match / (pot + cost_to_match)
-            if hand_strength > pot_odds + 0.1:  # Adjust for implied odds in tournament survival
-                return {"action": "match"}
+            if hand_strength > ctx.pot_odds + 0.1:  # Adjust for implied odds in tournament survival
+                return MATCH
             elif hand_strength > 0.6 and not is_facing_raise:
                 # Push over limp
-                return {"action": "increase", "amount": my_stack}
+                return {"action": "increase", "amount": ctx.my_stack}
             else:
-                return {"action": "fold"}
+                return FOLD
 
-    def preflop_logic(self, game_state, hole, my_position, num_active, big_blind, bet_to_match, cost_to_match, min_cost_to_increase, my_stack, current_log, pot, default_model):
+    def preflop_logic(self, ctx):
         # Preflop strategy: open raise, isolate limps, 3bet, call, fold
-        hand_strength = self.get_preflop_hand_strength(hole)
-        is_facing_raise = bet_to_match > big_blind
-        num_limpers = self.get_num_limpers(game_state)
+        hand_strength = self.get_preflop_hand_strength(ctx.hole)
+        is_facing_raise = ctx.bet_to_match > ctx.big_blind
+        num_limpers = ctx.num_limpers
         is_unopened = not is_facing_raise and num_limpers == 0
 
-        position_cat = self.get_position_category(my_position, num_active)
+        position_cat = self.get_position_category(ctx.my_pos, ctx.num_active)
 
         # Get last raiser if any
-        raisers = [a["player_id"] for a in current_log if a["action"] in ["raise", "bet", "all-in"]]
-        last_raiser = raisers[-1] if raisers else None
-        raiser_model = self.get_opponent_model(last_raiser) if last_raiser else default_model
+        last_raiser = _last_aggressor(ctx.hand_log, ctx.stage)
+        raiser_model = self.get_opponent_model(last_raiser) if last_raiser else DEFAULT_MODEL
 
         # Adjust thresholds based on opponent (exploit loose/tight)
         vpip_adjust = (raiser_model["vpip"] - 0.25) * 0.2  # Looser opponent: tighter call, wider 3bet
@@ -133,52 +391,51 @@ class GrokAgent(BasePokerAgent):
         if is_unopened:
             open_threshold = self.get_open_threshold(position_cat) - vpip_adjust  # Steal more vs tight
             if hand_strength > open_threshold:
-                size = self.get_open_size(game_state, num_active, big_blind)
-                amount = max(math.ceil(size), min_cost_to_increase)
-                amount = min(amount, my_stack)
+                size = self.get_open_size(ctx)
+                amount = _clamp_bet(size, ctx.min_cost_to_increase, ctx.my_stack)
                 return {"action": "increase", "amount": amount}
             else:
-                if cost_to_match == 0:  # BB check
-                    return {"action": "match"}
+                if ctx.cost_to_match == 0:  # BB check
+                    return MATCH
                 else:
-                    return {"action": "fold"}
+                    return FOLD
         elif not is_facing_raise:
             # Facing limps: isolate with wider range
             iso_threshold = self.get_iso_threshold(position_cat, num_limpers) - vpip_adjust
             call_threshold = iso_threshold - 0.1
             if hand_strength > iso_threshold:
-                size = self.get_iso_size(game_state, num_limpers, big_blind)
-                amount = max(math.ceil(size), min_cost_to_increase)
-                amount = min(amount, my_stack)
+                size = self.get_iso_size(ctx, num_limpers)
+                amount = _clamp_bet(size, ctx.min_cost_to_increase, ctx.my_stack)
                 return {"action": "increase", "amount": amount}
             elif hand_strength > call_threshold and position_cat in ["button", "small_blind"]:
-                return {"action": "match"}
+                return MATCH
             else:
-                if cost_to_match == 0:
-                    return {"action": "match"}
+                if ctx.cost_to_match == 0:
+                    return MATCH
                 else:
-                    return {"action": "fold"}
+                    return FOLD
         else:
             # Facing raise: 3bet or call
             threebet_threshold = self.get_threebet_threshold(position_cat, raiser_model) + pfr_adjust  # Tighter vs aggressive raiser
-            call_threshold = self.get_call_threshold(position_cat, raiser_model, game_state) - vpip_adjust  # Wider call vs loose
-            if hand_strength > threebet_threshold and game_state["your_status"]["can_raise"]:
-                size = self.get_threebet_size(game_state, bet_to_match, big_blind)
-                amount = max(math.ceil(size), min_cost_to_increase)
-                amount = min(amount, my_stack)
+            call_threshold = self.get_call_threshold(position_cat, raiser_model, ctx) - vpip_adjust  # Wider call vs loose
+            if hand_strength > threebet_threshold and ctx.can_raise:
+                size = self.get_threebet_size(ctx)
+                amount = _clamp_bet(size, ctx.min_cost_to_increase, ctx.my_stack)
                 return {"action": "increase", "amount": amount}
             elif hand_strength > call_threshold:
-                return {"action": "match"}
+                return MATCH
             else:
-                return {"action": "fold"}
+                return FOLD
 
-    def postflop_logic(self, game_state, hole, community, stage, my_position, pot, cost_to_match, min_cost_to_increase, my_stack, current_log, pot_odds, default_model):
+    def postflop_logic(self, ctx):
         # Postflop strategy: value bet/raise, semi-bluff, check/call/fold based on hand strength and draws
-        hand_type = self.evaluate_hand(hole, community)
+        hole, community, stage, pot, pot_odds = ctx.hole, ctx.community, ctx.stage, ctx.pot, ctx.pot_odds
+        enc = _encode_cards(hole, community)
+        hand_type = self.evaluate_hand(enc)
         category = hand_type[0]
-        pair_type = self.get_pair_strength(hole, community)
-        flush_draw = self.has_flush_draw(hole, community)
-        straight_draw = self.has_straight_draw(hole, community)
+        pair_type = self.get_pair_strength(enc)
+        flush_draw = self.has_flush_draw(enc)
+        straight_draw = self.has_straight_draw(enc)
 
         # Classify hand strength
         is_strong = (
@@ -193,247 +450,115 @@ class GrokAgent(BasePokerAgent):
         has_draw = flush_draw == True or straight_draw in ["oed", "gutshot"]
 
         # Adjust for board texture (aggressive on dry, cautious on wet)
-        wet_board = len(set(c[1] for c in community)) <= 2 or self.check_straight(communityRanks := sorted(set(self.rank_map[c[0]] for c in community)))
+        wet_board = enc.board_suits <= 2 or _board_has_straight_texture(enc.board_bits)
 
         # Get last bettor
-        bettors = [a["player_id"] for a in current_log if a["action"] in ["bet", "raise", "all-in"]]
-        last_bettor = bettors[-1] if bettors else None
-        bettor_model = self.get_opponent_model(last_bettor) if last_bettor else default_model
+        last_bettor = _last_aggressor(ctx.hand_log, stage)
+        bettor_model = self.get_opponent_model(last_bettor) if last_bettor else DEFAULT_MODEL
 
         # Position adjustment: more aggression in position (low position number = late to act)
-        in_position = my_position <= self.player_count // 2  # Lower position = later act
+        in_position = ctx.my_pos <= self.player_count // 2  # Lower position = later act
 
-        if cost_to_match == 0:
+        if ctx.cost_to_match == 0:
             # Unbetted: bet for value or bluff
             bluff_prob = 0.3 if stage == "flop" else 0.2 if stage == "turn" else 0.1
             if bettor_model["af"] < 1.5:  # Bluff more vs passive
                 bluff_prob += 0.1
             if is_strong or (has_draw and self._random.random() < bluff_prob and in_position and not wet_board):
                 bet_size = self.get_bet_size(stage, pot, wet_board)
-                amount = max(math.ceil(bet_size), min_cost_to_increase)
-                amount = min(amount, my_stack)
+                amount = _clamp_bet(bet_size, ctx.min_cost_to_increase, ctx.my_stack)
                 return {"action": "increase", "amount": amount}
             else:
-                return {"action": "match"}
+                return MATCH
         else:
             # Facing bet: raise for value, call with medium/draw if odds good, fold weak
             if is_strong and (bettor_model["vpip"] > 0.3 or not wet_board):  # Value raise vs loose
-                raise_size = self.get_raise_size(stage, bet_to_match, pot, wet_board)
-                amount = max(math.ceil(raise_size), min_cost_to_increase)
-                amount = min(amount, my_stack)
+                raise_size = self.get_raise_size(stage, ctx.bet_to_match, pot, wet_board)
+                amount = _clamp_bet(raise_size, ctx.min_cost_to_increase, ctx.my_stack)
                 return {"action": "increase", "amount": amount}
             elif is_medium and pot_odds < 0.25:  # Call if good odds (tournament survival: tighter on river)
                 if stage == "river":
                     if pot_odds < 0.2:
-                        return {"action": "match"}
+                        return MATCH
                 else:
-                    return {"action": "match"}
+                    return MATCH
             elif has_draw and pot_odds < 0.2 and stage != "river" and bettor_model["af"] < 2:  # Call draws vs passive
-                return {"action": "match"}
+                return MATCH
             else:
-                return {"action": "fold"}
+                return FOLD
 
     # Helper functions
 
     def get_opponent_model(self, pid):
-        if pid not in self.opponent_models:
-            return {"vpip": 0.25, "pfr": 0.15, "af": 2.0}
-        model = self.opponent_models[pid]
-        hands = model["hands"]
-        vpip = model["vpip_count"] / hands if hands > 0 else 0.25
-        pfr = model["pfr_count"] / hands if hands > 0 else 0.15
-        af = model["bet_raise_count"] / model["call_count"] if model["call_count"] > 0 else 2.0
-        return {"vpip": vpip, "pfr": pfr, "af": af}
+        # Ratios are precomputed in hand_ended
+        return self.opponent_models.get(pid, DEFAULT_MODEL)
 
     def get_preflop_hand_strength(self, hole):
-        # Heuristic strength score 0-1 for preflop hands (higher = better)
-        r1, s1 = hole[0][0], hole[0][1]
-        r2, s2 = hole[1][0], hole[1][1]
-        ranks = sorted([self.rank_map[r1], self.rank_map[r2]], reverse=True)
-        suited = s1 == s2
-        if ranks[0] == ranks[1]:  # Pairs
-            return 0.6 + (ranks[0] - 2) / 12 * 0.4  # 22: 0.6, AA: 1.0
-        base = (ranks[0] + ranks[1] - 4) / 24 * 0.4  # Scale sum
-        if suited:
-            base += 0.2
-        if abs(ranks[0] - ranks[1]) <= 2:
-            base += 0.1
-        if min(ranks) >= 10:
-            base += 0.1
-        if ranks[0] == 14:
-            base += 0.1
-        return min(base, 1.0)
+        # Heuristic strength score 0-1 for preflop hands (higher = better), see _preflop_strength
+        r1 = _RANK_LUT[ord(hole[0][0])]
+        r2 = _RANK_LUT[ord(hole[1][0])]
+        hi, lo = (r1, r2) if r1 >= r2 else (r2, r1)
+        return PREFLOP_STRENGTH[(hi, lo, hole[0][1] == hole[1][1])]
 
     def get_position_category(self, my_position, num_active):
-        # Categorize position for range adjustment
-        if num_active <= 2:
-            return "heads_up"
-        co = (num_active - 1) % num_active
-        hj = (num_active - 2) % num_active
-        if my_position == 0:
-            return "button"
-        if my_position == co:
-            return "cutoff"
-        if my_position == hj:
-            return "hijack"
-        if my_position == 1:
-            return "small_blind"
-        if my_position == 2:
-            return "big_blind"
-        return "early" if my_position >= 3 and my_position < num_active // 2 + 3 else "middle"
+        # Categorize position for range adjustment, see _position_category
+        return POSITION_CATEGORY[num_active][my_position]
 
     def get_open_threshold(self, position_cat):
         # Threshold for opening unraised pots (lower = wider range)
-        thresholds = {
-            "early": 0.65,
-            "middle": 0.55,
-            "hijack": 0.45,
-            "cutoff": 0.35,
-            "button": 0.25,
-            "small_blind": 0.3,
-            "big_blind": 0.0,  # Check
-            "heads_up": 0.2
-        }
-        return thresholds.get(position_cat, 0.65)
+        return OPEN_THRESHOLDS.get(position_cat, 0.65)
 
-    def get_open_size(self, game_state, num_active, big_blind):
+    def get_open_size(self, ctx):
         # Open size: smaller in late position, add for antes
-        base = 2.5 if num_active > 4 else 2.2
-        if game_state["ante"] > 0:
+        base = 2.5 if ctx.num_active > 4 else 2.2
+        if ctx.ante > 0:
             base += 0.5
-        return base * big_blind
-
-    def get_num_limpers(self, game_state):
-        # Count limpers before me
-        bet_to_match = game_state["bet_to_match"]
-        my_pos = game_state["your_status"]["position"]
-        limpers = 0
-        for p in game_state["players"]:
-            if p["hand_status"] == "active" and p["position"] > 2 and p["position"] < my_pos and p["current_bet_this_stage"] == bet_to_match:
-                limpers += 1
-        return limpers
+        return base * ctx.big_blind
 
     def get_iso_threshold(self, position_cat, num_limpers):
         # Threshold for isolating limps (wider with more limpers)
         base = self.get_open_threshold(position_cat) + 0.05 * num_limpers
         return max(0.3, base - 0.1)  # Wider in position
 
-    def get_iso_size(self, game_state, num_limpers, big_blind):
+    def get_iso_size(self, ctx, num_limpers):
         # Isolate size: larger with more limpers
         base = 3 + num_limpers
-        if game_state["ante"] > 0:
+        if ctx.ante > 0:
             base += 1
-        return base * big_blind
+        return base * ctx.big_blind
 
     def get_threebet_threshold(self, position_cat, raiser_model):
         # Threshold for 3betting (tighter OOP, wider vs loose opens)
-        base = 0.7 if position_cat in ["early", "middle", "big_blind"] else 0.6
+        base = 0.7 if position_cat in OOP_CATEGORIES else 0.6
         adjust = (0.25 - raiser_model["pfr"]) * 0.2  # 3bet wider vs low PFR (weak opens)
         return base + adjust
 
-    def get_call_threshold(self, position_cat, raiser_model, game_state):
+    def get_call_threshold(self, position_cat, raiser_model, ctx):
         # Threshold for calling raises (wider in position, vs loose raiser)
-        base = 0.5 if position_cat in ["button", "cutoff", "big_blind"] else 0.6
+        base = 0.5 if position_cat in WIDE_CALL_CATEGORIES else 0.6
         adjust = (raiser_model["vpip"] - 0.25) * 0.2  # Wider call vs loose
-        pot_odds_adjust = game_state["cost_to_match"] / (sum(p["amount"] for p in game_state["pots"]) + game_state["cost_to_match"]) * 0.1
+        pot_odds_adjust = ctx.pot_odds * 0.1  # 0 when there is nothing to call
         return base - adjust - pot_odds_adjust
 
-    def get_threebet_size(self, game_state, bet_to_match, big_blind):
+    def get_threebet_size(self, ctx):
         # 3bet size: 3x facing size, larger OOP or with antes
-        facing_size = bet_to_match / big_blind
+        facing_size = ctx.bet_to_match / ctx.big_blind
         base = 3 * facing_size
-        if game_state["your_status"]["position"] > 2:  # OOP larger
+        if ctx.my_pos > 2:  # OOP larger
             base += 1
-        if game_state["ante"] > 0:
+        if ctx.ante > 0:
             base += 0.5
-        return base * big_blind
+        return base * ctx.big_blind
 
-    def evaluate_hand(self, hole, board):
-        # Simple hand evaluator returning (category, tiebreakers)
+    def evaluate_hand(self, enc):
+        # Returns (category, tiebreakers)
         # Categories: 8=straight flush, 7=quads, 6=full, 5=flush, 4=straight, 3=three, 2=two pair, 1=pair, 0=high
-        cards = hole + board
-        ranks = [self.rank_map[c[0]] for c in cards]
-        suits = [c[1] for c in cards]
-        sorted_ranks = sorted(ranks, reverse=True)
-        count = collections.Counter(ranks)
-        suit_groups = collections.defaultdict(list)
-        for i, r in enumerate(ranks):
-            suit_groups[suits[i]].append(r)
-        for sg in suit_groups:
-            suit_groups[sg].sort(reverse=True)
-
-        # Flush suit
-        flush_suit = max(suit_groups, key=lambda s: len(suit_groups[s])) if max(len(suit_groups[s]) for s in suit_groups) >= 5 else None
-
-        # Straight flush
-        if flush_suit:
-            fr = sorted(suit_groups[flush_suit], reverse=True)
-            sf, sf_high = self.check_straight(fr)
-            if sf:
-                return (8, sf_high)
-
-        # Quads
-        quads = [r for r in count if count[r] == 4]
-        if quads:
-            qr = max(quads)
-            kicker = max(r for r in sorted_ranks if r != qr)
-            return (7, qr, kicker)
-
-        # Full house
-        threes = [r for r in count if count[r] == 3]
-        pairs = [r for r in count if count[r] == 2]
-        if threes and (pairs or len(threes) >= 2):
-            tr = max(threes)
-            pr = max(pairs) if pairs else sorted(threes)[-2]
-            return (6, tr, pr)
-
-        # Flush
-        if flush_suit:
-            fr = tuple(suit_groups[flush_suit][:5])
-            return (5, fr)
-
-        # Straight
-        ur = sorted(set(ranks), reverse=True)
-        st, sh = self.check_straight(ur)
-        if st:
-            return (4, sh)
-
-        # Three of a kind
-        if threes:
-            tr = max(threes)
-            kickers = sorted([r for r in set(ranks) if r != tr], reverse=True)[:2]
-            return (3, tr, tuple(kickers))
-
-        # Two pair
-        if len(pairs) >= 2:
-            prs = sorted(pairs, reverse=True)[:2]
-            kicker = max(r for r in set(ranks) if r not in prs)
-            return (2, tuple(prs), kicker)
-
-        # Pair
-        if pairs:
-            pr = max(pairs)
-            kickers = sorted([r for r in set(ranks) if r != pr], reverse=True)[:3]
-            return (1, pr, tuple(kickers))
-
-        # High card
-        return (0, tuple(sorted_ranks[:5]))
-
-    def check_straight(self, sorted_ranks):
-        if len(sorted_ranks) < 5:
-            return False, 0
-        # Wheel
-        if 14 in sorted_ranks and all(x in sorted_ranks for x in [2, 3, 4, 5]):
-            return True, 5
-        for i in range(len(sorted_ranks) - 4):
-            if sorted_ranks[i] - sorted_ranks[i + 4] == 4:
-                return True, sorted_ranks[i]
-        return False, 0
-
-    def get_pair_strength(self, hole, board):
+        return _best_hand(tuple(enc.card_ints))
+
+    def get_pair_strength(self, enc):
         # Classify pair type relative to board
-        board_ranks = sorted([self.rank_map[c[0]] for c in board], reverse=True)
-        hole_ranks = [self.rank_map[c[0]] for c in hole]
+        board_ranks = enc.board_ranks
+        hole_ranks = enc.hole_ranks
         paired_rank = None
         if hole_ranks[0] == hole_ranks[1]:
             paired_rank = hole_ranks[0]
@@ -453,32 +578,30 @@ class GrokAgent(BasePokerAgent):
             return "middle_pair"
         return "bottom_pair"
 
-    def has_flush_draw(self, hole, board):
-        suits = [c[1] for c in hole + board]
-        count = collections.Counter(suits)
-        max_c = max(count.values())
+    def has_flush_draw(self, enc):
+        # A suit's card count is the popcount of its rank bitmask
+        max_c = max(b.bit_count() for b in enc.suit_bits)
         if max_c >= 5:
             return "flush_made"
         if max_c == 4:
             return True
         return False
 
-    def has_straight_draw(self, hole, board):
-        ranks = sorted(set([self.rank_map[c[0]] for c in hole + board]))
-        if len(ranks) < 4:
+    def has_straight_draw(self, enc):
+        rank_bits = enc.rank_bits
+        if rank_bits.bit_count() < 4:
             return None
-        # Open-ended
-        for i in range(len(ranks) - 3):
-            if ranks[i + 3] - ranks[i] == 3:
+        # Open-ended: 4 ranks in a row
+        for low in range(2, 12):
+            if (rank_bits >> low) & 0b1111 == 0b1111:
                 return "oed"
-        # Gutshot
-        for i in range(len(ranks) - 3):
-            if ranks[i + 3] - ranks[i] == 4:
+        # Gutshot: 4 of the 5 ranks in a window
+        for low in range(2, 11):
+            if ((rank_bits >> low) & 0b11111).bit_count() == 4:
                 return "gutshot"
-        # Wheel draws
-        low_set = {2, 3, 4, 5, 14}
-        if len(low_set.intersection(ranks)) == 4:
-            return "gutshot" if 14 in ranks else "oed"
+        # Wheel draws: 4 of A-2-3-4-5
+        if (rank_bits & WHEEL_BITS).bit_count() == 4:
+            return "gutshot" if rank_bits >> 14 & 1 else "oed"
         return None
 
     def get_bet_size(self, stage, pot, wet_board):
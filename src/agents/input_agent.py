@@ -1,38 +1,31 @@
 from .base_agent import BasePokerAgent
+import functools
+import sys
+import types
 
 def prompt_confirm(prompt: str = None):
     if prompt is None:
         prompt = "Press enter to continue..."
     input(prompt)
 
-def get_positions(n: int):
-    """Yields indexes of Dealer, Small Blind, Big Blind and Under the Gun."""
+@functools.lru_cache(maxsize=16)
+def get_positions(n: int) -> tuple:
+    """Returns indexes of Dealer, Small Blind, Big Blind and Under the Gun."""
 
     if n == 2:
-        yield 0     # Dealer
-        yield 0     # Small Blind
-        yield 1     # Big Blind
-        yield 0     # Under the Gun
-        return
+        # Dealer and Small Blind are the same seat heads-up, then Dealer acts first
+        return 0, 0, 1, 0
 
-    yield 0         # Dealer
-    yield 1         # Small Blind
-    yield 2         # Big Blind
-    yield 3 % n     # Under the Gun
+    return 0, 1, 2, 3 % n
 
 def box_padding(pretty_list: list, highlighted: bool = False, boundary_char: str = "*"):
-    longest_item = max(pretty_list, key=len)
-    padding_to = max(len(longest_item) + 2, 22)
-    padded_list = []
-    for item in pretty_list:
-        short = padding_to - len(item)
-        even_padding = short // 2
-        odd_padding = short % 2
-        item = even_padding * " " + item + even_padding * " "
-        if odd_padding:
-            item = " " + item
-        item = item + boundary_char
-        padded_list.append(item)
+    padding_to = max(max(map(len, pretty_list)) + 2, 22)
+    # Centre each item with any odd space on the left; str.center picks the
+    # side by width parity, so add the left padding first and then the right
+    padded_list = [
+        item.rjust(padding_to - (padding_to - len(item)) // 2).ljust(padding_to) + boundary_char
+        for item in pretty_list
+    ]
 
     top_boundary_char = boundary_char if highlighted else " "
     top_padding = padding_to * top_boundary_char + boundary_char
@@ -42,14 +35,16 @@ def box_padding(pretty_list: list, highlighted: bool = False, boundary_char: str
     return padded_list
 
 def splice(pretty_lists: list[list], boundary_char: str = "*"):
-    longest_item = max(pretty_lists, key=len)
-    total_items = len(longest_item)
-    spliced_list = []
-    for i in range(total_items):
-        spliced_list.append(boundary_char)
-        for item in pretty_lists:
-            spliced_list[i] = spliced_list[i] + item[i]
-    return spliced_list
+    # Boxes from box_padding all have the same number of rows
+    return [boundary_char + "".join(row) for row in zip(*pretty_lists)]
+
+# Unicode symbol and ANSI color code per suit
+SUITS = types.MappingProxyType({
+    's': ('♠', 30),  # black
+    'h': ('♥', 31),  # red
+    'd': ('♦', 33),  # yellow
+    'c': ('♣', 34),  # blue
+})
 
 def pretty_card(card: str) -> str:
     """
@@ -57,28 +52,108 @@ def pretty_card(card: str) -> str:
     into colored string with Unicode suit.
     """
 
+    pretty = PRETTY_CARDS.get(card)
+    if pretty is None:
+        pretty = render_card(card)
+    return pretty
+
+def render_card(card: str) -> str:
+    """Validating conversion behind pretty_card, for cards outside the precomputed deck."""
+
     if len(card) != 2:
         raise ValueError("Card must be 2 characters like 'As', 'Th', '9d'")
 
     rank = card[0]
     suit = card[1].lower()
 
-    suits = {
-        's': ('♠', 30),  # black
-        'h': ('♥', 31),  # red
-        'd': ('♦', 33),  # yellow
-        'c': ('♣', 34),  # blue
-    }
-
-    if suit not in suits:
+    if suit not in SUITS:
         raise ValueError("Invalid suit. Use s, h, d, or c.")
 
-    symbol, color_code = suits[suit]
+    symbol, color_code = SUITS[suit]
 
     return f"\033[{color_code}m[{rank}{symbol}]\033[0m"
 
+# The 52 cards the engine deals, rendered once at import
+PRETTY_CARDS = {rank + suit: render_card(rank + suit) for rank in "23456789TJQKA" for suit in "shdc"}
+
+
+# Logged actions that are shown with the chips they cost
+COST_ACTIONS = frozenset(('ante', 'small-blind', 'big-blind', 'bet', 'call', 'raise', 'all-in'))
+
+# Accepted commands and their aliases, resolved to the action sent to the engine
+ACTION_ALIASES = {
+    'match': 'match',
+    'check': 'match',
+    'call': 'match',
+    'increase': 'increase',
+    'bet': 'increase',
+    'raise': 'increase',
+    'all-in': 'all-in',
+    'fold': 'fold',
+}
+
+
+# Commentary templates for pick_commentary; only the chosen one gets {gain}/{loss}/{end_at} filled in
+WIN_SHOWDOWN_LINES = (
+    "You take it all the way to showdown and are rewarded with {gain}!",
+    "You show down the best hand and collect {gain} for your patience!",
+    "You trusted your hand to the end, and it pays off with {gain}!",
+    "You let the cards speak at showdown and they speak in your favor!",
+)
+
+WIN_UNCONTESTED_LINES = (
+    "You apply pressure and everyone folds. {gain} gained without a showdown!",
+    "You take it down on the {end_at} and collect {gain} uncontested!",
+    "You didn’t need to show your cards. The {gain} pot slides your way!",
+    "You push them out before showdown and quietly stack {gain}!",
+)
+
+BIG_WIN_LINES = (
+    "You turned that into a massive score. That one changes stacks.",
+    "You didn’t just win — you made a statement.",
+)
+
+ELIMINATED_LINES = (
+    "And that’s it. You’re out. No chips. No comeback. Just a long walk away from the table.",
+    "Your stack hits zero. The tournament continues — without you.",
+    "You fought. You gambled. You’re gone.",
+    "The last chip slides away, and so do you.",
+)
+
+LOSS_AT_SHOWDOWN_LINES = (
+    "Better luck next time.",
+    "You make it to showdown, but your hand comes up short.",
+    "You pay to see it and pay the price. Your {loss} must be missing you.",
+    "You go the distance, only to watch {loss} slide away.",
+    "You show your cards — and wish you hadn’t. That's {loss} less for you.",
+)
+
+LOSS_FOLDED_BEFORE_SHOWDOWN_LINES = (
+    "You commit {loss} this hand and don’t get them back.",
+    "You invest {loss}, but this one doesn’t go your way.",
+    "You put {loss} into the middle and they stay there.",
+    "You step away from the pot, down {loss} this hand.",
+    "You test the waters and retreat, {loss} lighter.",
+)
+
+LOSS_UNCONTESTED_LINES = (
+    "You invest {loss} but can’t continue on the {end_at}.",
+    "You let it go before showdown, leaving your {loss} behind.",
+    "You step away from the pot, down {loss} this hand.",
+    "You test the waters and retreat, {loss} lighter.",
+)
+
+BREAK_EVEN_LINES = (
+    "You navigate the hand carefully and come out exactly where you started.",
+    "No harm done. Your stack remains unchanged.",
+    "You get involved, but the dust settles with no chips gained or lost.",
+    "A neutral result — you live to fight the next hand.",
+)
+
 
 class InputAgent(BasePokerAgent):
+    __slots__ = ("dollar_per_chip", "player_names")
+
     def __init__(self, seed: int = None, name: str = "Input Agent", dollar_per_chip: int = 5, player_names: dict = None):
         if dollar_per_chip < 1:
             raise ValueError("Dollar to chip ratio should at least be 1")
@@ -92,7 +167,7 @@ class InputAgent(BasePokerAgent):
     def chip2dollar(self, amount: int) -> str:
         if amount < 0:
             raise ValueError("Cannot convert negative amount of chips")
-        return f"${self.dollar_per_chip * amount}"
+        return "$" + str(self.dollar_per_chip * amount)
 
     # Someone please move this monstrosity somewhere else
     def pick_commentary(self,
@@ -110,81 +185,29 @@ class InputAgent(BasePokerAgent):
 
         # --- WIN CASE ---
         if won:
-            pretty_gain = self.chip2dollar(winnings)
-            if showdown:
-                lines = [
-                    f"You take it all the way to showdown and are rewarded with {pretty_gain}!",
-                    f"You show down the best hand and collect {pretty_gain} for your patience!",
-                    f"You trusted your hand to the end, and it pays off with {pretty_gain}!",
-                    f"You let the cards speak at showdown and they speak in your favor!",
-                ]
-            else:
-                lines = [
-                    f"You apply pressure and everyone folds. {pretty_gain} gained without a showdown!",
-                    f"You take it down on the {end_at.capitalize()} and collect {pretty_gain} uncontested!",
-                    f"You didn’t need to show your cards. The {pretty_gain} pot slides your way!",
-                    f"You push them out before showdown and quietly stack {pretty_gain}!",
-                ]
+            lines = WIN_SHOWDOWN_LINES if showdown else WIN_UNCONTESTED_LINES
 
             # Big win variation
             if net > total_bet_this_hand * 3:
-                lines += [
-                    f"You turned that into a massive score. That one changes stacks.",
-                    f"You didn’t just win — you made a statement.",
-                ]
+                lines = lines + BIG_WIN_LINES
 
-            return random.choice(lines)
+            return random.choice(lines).format(gain=self.chip2dollar(winnings), end_at=end_at.capitalize())
 
         # --- LOSS CASE ---
         if lost:
-            loss = -net
-            pretty_loss = self.chip2dollar(loss)
-
             if stack == 0:
-                lines = [
-                    f"And that’s it. You’re out. No chips. No comeback. Just a long walk away from the table.",
-                    f"Your stack hits zero. The tournament continues — without you.",
-                    f"You fought. You gambled. You’re gone.",
-                    f"The last chip slides away, and so do you.",
-                ]
-
+                lines = ELIMINATED_LINES
             elif showdown and hand_status == 'active':
-                lines = [
-                    f"Better luck next time.",
-                    f"You make it to showdown, but your hand comes up short.",
-                    f"You pay to see it and pay the price. Your {pretty_loss} must be missing you.",
-                    f"You go the distance, only to watch {pretty_loss} slide away.",
-                    f"You show your cards — and wish you hadn’t. That's {pretty_loss} less for you.",
-                ]
-
+                lines = LOSS_AT_SHOWDOWN_LINES
             elif showdown:
-                lines = [
-                    f"You commit {pretty_loss} this hand and don’t get them back.",
-                    f"You invest {pretty_loss}, but this one doesn’t go your way.",
-                    f"You put {pretty_loss} into the middle and they stay there.",
-                    f"You step away from the pot, down {pretty_loss} this hand.",
-                    f"You test the waters and retreat, {pretty_loss} lighter.",
-                ]
-
+                lines = LOSS_FOLDED_BEFORE_SHOWDOWN_LINES
             else:
-                lines = [
-                    f"You invest {pretty_loss} but can’t continue on the {end_at.capitalize()}.",
-                    f"You let it go before showdown, leaving your {pretty_loss} behind.",
-                    f"You step away from the pot, down {pretty_loss} this hand.",
-                    f"You test the waters and retreat, {pretty_loss} lighter.",
-                ]
+                lines = LOSS_UNCONTESTED_LINES
 
-            return random.choice(lines)
+            return random.choice(lines).format(loss=self.chip2dollar(-net), end_at=end_at.capitalize())
 
         # --- BREAK EVEN ---
-        lines = [
-            "You navigate the hand carefully and come out exactly where you started.",
-            "No harm done. Your stack remains unchanged.",
-            "You get involved, but the dust settles with no chips gained or lost.",
-            "A neutral result — you live to fight the next hand.",
-        ]
-
-        return random.choice(lines)
+        return random.choice(BREAK_EVEN_LINES)
 
     def pretty_player_name(self, player_id: int):
         player_name = self.player_names.get(player_id)
@@ -193,11 +216,7 @@ class InputAgent(BasePokerAgent):
         return player_name
 
     def pretty_player_names(self, player_ids: list[int]):
-        pretty_str = ""
-        for player_id in player_ids:
-            pretty_str = pretty_str + f"{self.pretty_player_name(player_id)}, "
-        pretty_str = pretty_str.rstrip(", ")
-        return pretty_str
+        return ", ".join(self.pretty_player_name(player_id) for player_id in player_ids)
 
     def pretty_start_players(self, your_id: int, players, boundary_char: str = "*"):
         pretty_status = []
@@ -219,14 +238,11 @@ class InputAgent(BasePokerAgent):
         return spliced_status
 
     def pretty_players(self, your_id: int, players, logs, current_stage, boundary_char: str = "*"):
+        chip2dollar = self.chip2dollar  # Called for every stack, pot and cost shown
         dealer, sb ,bb, _ = get_positions(len(players))
-        cost_action = ['ante',
-                        'small-blind',
-                        'big-blind',
-                        'bet',
-                        'call',
-                        'raise',
-                        'all-in']
+
+        # Each player's latest action this stage; later log entries overwrite earlier ones
+        recent_actions = {item['player_id']: item for item in logs if item['stage'] == current_stage}
 
         pretty_status = []
         for player_status in players:
@@ -234,26 +250,21 @@ class InputAgent(BasePokerAgent):
             pretty_id = f"{self.pretty_player_name(player_id)}"
 
             position = player_status['position']
-            pretty_position = ""
+            position_names = []
             if position == dealer:
-                pretty_position = pretty_position + "Dealer/"
+                position_names.append("Dealer")
             if position == sb:
-                pretty_position = pretty_position + "Small Blind/"
+                position_names.append("Small Blind")
             if position == bb:
-                pretty_position = pretty_position + "Big Blind/"
-            pretty_position = pretty_position.rstrip('/')
-            if pretty_position:
-                pretty_position = f"({pretty_position})"
+                position_names.append("Big Blind")
+            pretty_position = ""
+            if position_names:
+                pretty_position = f"({'/'.join(position_names)})"
 
             stack = player_status['stack']
-            pretty_stack = f"Stack {self.chip2dollar(stack)}"
+            pretty_stack = f"Stack {chip2dollar(stack)}"
 
-            recent_action = None
-            logs = [l for l in logs if l['stage'] == current_stage]
-            for item in reversed(logs):
-                if item['player_id'] == player_id:
-                    recent_action = item
-                    break
+            recent_action = recent_actions.get(player_id)
             pretty_action = ""
             if player_status['hand_status'] == 'all-in':
                 pretty_action = "All-in"
@@ -262,9 +273,9 @@ class InputAgent(BasePokerAgent):
             if recent_action:
                 action_name = recent_action['action']
                 pretty_action_name = action_name.capitalize()
-                if action_name in cost_action:
+                if action_name in COST_ACTIONS:
                     cost = recent_action['cost']
-                    pretty_cost = self.chip2dollar(cost)
+                    pretty_cost = chip2dollar(cost)
                     pretty_action = f"{pretty_action_name} {pretty_cost}"
                 else:
                     pretty_action = pretty_action_name
@@ -288,9 +299,8 @@ class InputAgent(BasePokerAgent):
             hole_cards = player['hole_cards']
             pretty_hole_cards = ""
             if hole_cards:
-                for card in hole_cards:
-                    pretty_hole_cards = pretty_hole_cards + f" [{card}]"
-                    list_to_replace.append(card)
+                pretty_hole_cards = "".join(f" [{card}]" for card in hole_cards)
+                list_to_replace.extend(hole_cards)
 
             stack = player['stack']
             pretty_stack = f"Stack {self.chip2dollar(stack)}"
@@ -332,12 +342,12 @@ class InputAgent(BasePokerAgent):
 
         pretty_print.append(f"These are your opponents. Defeat them and win a million.")
 
-        for item in pretty_print:
-            print(item)
+        sys.stdout.write("\n".join(pretty_print) + "\n")
 
         prompt_confirm()
 
     def pretty_print_game_state(self, game_state: dict):
+        chip2dollar = self.chip2dollar  # Called for every stack, pot and cost shown
         pretty_print = ["------ GAME STATE ------"]
 
         hand_id = game_state['hand_id']
@@ -346,9 +356,9 @@ class InputAgent(BasePokerAgent):
         big_blind = game_state['big_blind']
         your_id = game_state['your_status']['player_id']
         pretty_print.append(f"[ Hand {hand_id} / "
-                            f"Ante {self.chip2dollar(ante)} / "
-                            f"Small Blind {self.chip2dollar(small_blind)} / "
-                            f"Big Blind {self.chip2dollar(big_blind)} ] "
+                            f"Ante {chip2dollar(ante)} / "
+                            f"Small Blind {chip2dollar(small_blind)} / "
+                            f"Big Blind {chip2dollar(big_blind)} ] "
                             f"You are playing as {self.pretty_player_name(your_id)}")
 
         players = game_state['players']
@@ -360,7 +370,8 @@ class InputAgent(BasePokerAgent):
         stage_pot = game_state['stage_pot']
         pots = game_state['pots']
 
-        pretty_pots = f" | Stage Pot {self.chip2dollar(stage_pot)}"
+        # First slot is filled with the total once every pot has been added up
+        pot_parts = [None, f"Stage Pot {chip2dollar(stage_pot)}"]
         total_pot = stage_pot
         for index, pot in enumerate(pots):
             stack = pot['amount']
@@ -368,26 +379,22 @@ class InputAgent(BasePokerAgent):
 
             # When it's the main pot
             if index == 0:
-                pretty_pots = pretty_pots + f" | Main Pot {self.chip2dollar(stack)}"
+                pot_parts.append(f"Main Pot {chip2dollar(stack)}")
             # When it's a side pot
             else:
                 pretty_eligibles = self.pretty_player_names(eligible_players)
-                pretty_pots = pretty_pots + f" | Side Pot {self.chip2dollar(stack)} ({pretty_eligibles})"
+                pot_parts.append(f"Side Pot {chip2dollar(stack)} ({pretty_eligibles})")
             total_pot += stack
-        pretty_pots = f"Total Pot {self.chip2dollar(total_pot)}" + pretty_pots
-        pretty_print.append(pretty_pots)
+        pot_parts[0] = f"Total Pot {chip2dollar(total_pot)}"
+        pretty_print.append(" | ".join(pot_parts))
 
         pretty_community = f"{current_stage.capitalize()}"
         community_cards = game_state['community_cards']
         if community_cards:
-            pretty_community = pretty_community + ": "
-            for card in community_cards:
-                pretty_community = pretty_community + f"{pretty_card(card)} "
+            pretty_community = pretty_community + ": " + " ".join(map(pretty_card, community_cards))
         pretty_print.append(pretty_community)
 
-        pretty_hole = f"Your private cards: "
-        for card in game_state['hole_cards']:
-            pretty_hole = pretty_hole + f"{pretty_card(card)} "
+        pretty_hole = "Your private cards: " + " ".join(map(pretty_card, game_state['hole_cards']))
         pretty_print.append(pretty_hole)
 
         bet_to_call = game_state['bet_to_match']
@@ -396,18 +403,17 @@ class InputAgent(BasePokerAgent):
         can_raise = game_state['your_status']['can_raise']
         if bet_to_call == 0:
             pretty_cost = f"Check to stay in the hand. "\
-                          f"Or bet at least {self.chip2dollar(min_cost_to_increase)}."
+                          f"Or bet at least {chip2dollar(min_cost_to_increase)}."
         else:
             if cost_to_match == 0:
                 pretty_cost = f"Check to stay in the hand."
             else:
-                pretty_cost = f"Spend {self.chip2dollar(cost_to_match)} to call."
+                pretty_cost = f"Spend {chip2dollar(cost_to_match)} to call."
             if can_raise:
-                pretty_cost = pretty_cost + f" Or spend at least {self.chip2dollar(min_cost_to_increase)} to raise."
+                pretty_cost = pretty_cost + f" Or spend at least {chip2dollar(min_cost_to_increase)} to raise."
         pretty_print.append(pretty_cost)
 
-        for item in pretty_print:
-            print(item)
+        sys.stdout.write("\n".join(pretty_print) + "\n")
 
     def pretty_print_hand_history(self, hand_history):
         pretty_print = ["------ HAND HISTORY ------"]
@@ -433,9 +439,7 @@ class InputAgent(BasePokerAgent):
         pretty_community = f"{end_at.capitalize()}"
         community_cards = hand_history['community_cards']
         if community_cards:
-            pretty_community = pretty_community + ": "
-            for card in community_cards:
-                pretty_community = pretty_community + f"{pretty_card(card)} "
+            pretty_community = pretty_community + ": " + " ".join(map(pretty_card, community_cards))
         pretty_print.append(pretty_community)
 
         total_bet_this_hand = hand_history['your_result']['total_bet_this_hand']
@@ -454,8 +458,7 @@ class InputAgent(BasePokerAgent):
         else:
             pretty_print.append(f"Your game continues on.")
 
-        for item in pretty_print:
-            print(item)
+        sys.stdout.write("\n".join(pretty_print) + "\n")
 
         prompt_confirm()
 
@@ -464,33 +467,22 @@ class InputAgent(BasePokerAgent):
 
     def decide_action(self, game_state: dict):
         self.pretty_print_game_state(game_state)
-        valid_actions = ('match', 'increase', 'fold')
-        action = ''
-        amount = 0
-        while action not in valid_actions:
-            cmd = input("Input your action (match/increase/fold): ")
-            to_list = cmd.split(' ')
-            action = to_list[0]
-
-            # Resolve alias
-            if action in ['check', 'call']:
-                action = 'match'
-            elif action in ['bet', 'raise']:
-                action = 'increase'
+        while True:
+            parts = input("Input your action (match/increase/fold): ").split()
+            if not parts:
+                continue
+            action = ACTION_ALIASES.get(parts[0])
 
             if action == 'increase':
-                if len(to_list) > 1:
-                    amount = to_list[1]
-                    if amount.isdigit():
-                        amount = abs(int(amount)) // self.dollar_per_chip
-                if not amount:
-                    action = ''
-
-            if action == 'all-in':
-                action = 'increase'
-                amount = game_state['your_status']['stack']
-
-        return {'action': action, 'amount': amount}
+                # Amount is in dollars; re-prompt unless it converts to at least one chip
+                if len(parts) > 1 and parts[1].isdigit():
+                    amount = int(parts[1]) // self.dollar_per_chip
+                    if amount:
+                        return {'action': 'increase', 'amount': amount}
+            elif action == 'all-in':
+                return {'action': 'increase', 'amount': game_state['your_status']['stack']}
+            elif action is not None:
+                return {'action': action, 'amount': 0}
 
     def hand_ended(self, hand_history):
         self.pretty_print_hand_history(hand_history)
@@ -1,4 +1,6 @@
 class ChipStack:
+    __slots__ = ("_amount",)
+
     def __init__(self, amount: int = 0):
         assert amount >= 0
         self._amount = amount
@@ -11,14 +13,16 @@ class ChipStack:
         return self._amount
 
     def pop(self, amount: int) -> int:
-        if amount < 0:
-            raise ValueError("Cannot remove negative chips")
-        if amount > self._amount:
+        remaining = self._amount - amount
+        if remaining < 0 or amount < 0:
+            # Work out which rule was broken only on the error path
+            if amount < 0:
+                raise ValueError("Cannot remove negative chips")
             raise ValueError(
                 f"Stack has insufficient chips "
                 f"({self._amount} < {amount})"
             )
-        self._amount -= amount
+        self._amount = remaining
         return amount
 
     def add(self, amount: int) -> None:
@@ -0,0 +1,5 @@
+import os
+import sys
+
+# Agents are imported as the `agents` package from src/, the same way the engine does
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "src"))
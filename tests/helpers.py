@@ -0,0 +1,48 @@
+"""
+Builders for the start_state and game_state dicts the engine hands to agents.
+
+Every player sits at position == player_id and we are player 0.
+"""
+
+
+def make_players(count=3, stack=3000, total_bet=0, bets=None):
+    bets = bets or {}
+    return [
+        {"player_id": pid, "position": pid, "stack": stack, "hand_status": "active",
+         "current_bet_this_stage": bets.get(pid, 0), "total_bet_this_hand": total_bet}
+        for pid in range(count)
+    ]
+
+
+def make_start_state(count=3, stack=3000, big_blind=50):
+    return {
+        "initial_stack_per_player": stack,
+        "player_count": count,
+        "level_one_big_blind": big_blind,
+        "your_status": {"player_id": 0},
+        "players": make_players(count, stack),
+    }
+
+
+def make_game_state(hole_cards, community_cards=(), stage=None, pots=(), bet_to_match=0,
+                    cost_to_match=0, min_cost_to_increase=100, hand_log=(), players=None, hand_id=1):
+    players = players or make_players()
+    if stage is None:
+        stage = {0: "pre-flop", 3: "flop", 4: "turn", 5: "river"}[len(community_cards)]
+    return {
+        "hand_id": hand_id,
+        "ante": 0,
+        "small_blind": 25,
+        "big_blind": 50,
+        "current_stage": stage,
+        "players": players,
+        "your_status": dict(players[0], can_raise=True),
+        "hole_cards": list(hole_cards),
+        "community_cards": list(community_cards),
+        "pots": [dict(pot) for pot in pots],
+        "stage_pot": sum(p["current_bet_this_stage"] for p in players),
+        "bet_to_match": bet_to_match,
+        "cost_to_match": cost_to_match,
+        "min_cost_to_increase": min_cost_to_increase,
+        "hand_log": [dict(entry) for entry in hand_log],
+    }
@@ -0,0 +1,39 @@
+import itertools
+import unittest
+
+from agents.chatgpt_agent import ChatgptAgent
+from tests.helpers import make_game_state, make_start_state
+
+DECK = [rank + suit for rank in "23456789TJQKA" for suit in "shdc"]
+HANDS = [list(pair) for pair in itertools.combinations(DECK, 2)]
+
+
+class PreflopStrengthBatchTest(unittest.TestCase):
+    def test_batch_matches_single_hand_evaluation(self):
+        agent = ChatgptAgent(seed=3)
+        batch = ChatgptAgent.evaluate_preflop_strength_batch(HANDS)
+        self.assertEqual(batch, [agent._evaluate_preflop_strength(hand) for hand in HANDS])
+
+    def test_batch_strength_predicts_decide_action(self):
+        # 60bb deep in the first seat, facing the big blind: 3-bet from 0.70,
+        # call from the 0.40 opening threshold + 0.05, fold below that
+        agent = ChatgptAgent(seed=3)
+        agent.game_start(make_start_state())
+        batch = ChatgptAgent.evaluate_preflop_strength_batch(HANDS)
+        seen = set()
+        for hand, strength in zip(HANDS, batch):
+            state = make_game_state(hand, bet_to_match=50, cost_to_match=50)
+            action = agent.decide_action(state)["action"]
+            if strength >= 0.70:
+                expected = "increase"
+            elif strength >= 0.40 + 0.05:
+                expected = "match"
+            else:
+                expected = "fold"
+            self.assertEqual(action, expected, hand)
+            seen.add(action)
+        self.assertEqual(seen, {"increase", "match", "fold"})
+
+
+if __name__ == "__main__":
+    unittest.main()
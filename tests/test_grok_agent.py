@@ -0,0 +1,75 @@
+import unittest
+
+from agents.grok_agent import GrokAgent, _board_has_straight_texture
+from tests.helpers import make_game_state, make_players, make_start_state
+
+STACK = 5000
+
+
+def make_agent():
+    agent = GrokAgent(seed=7)
+    agent.game_start(make_start_state(stack=STACK))
+    # One hand where player 1 called pre-flop makes them loose (VPIP 1.0)
+    agent.hand_ended({
+        "hand_log": [
+            {"player_id": 1, "stack_before": STACK, "action": "call", "cost": 50, "stage": "pre-flop"},
+        ],
+        "player_results": [{"player_id": pid, "stack": STACK} for pid in range(3)],
+    })
+    return agent
+
+
+def facing_flop_bet(hole_cards, community_cards, bet=150):
+    return make_game_state(
+        hole_cards,
+        community_cards,
+        pots=[{"amount": 300, "eligible_players": [0, 1, 2]}],
+        bet_to_match=bet,
+        cost_to_match=bet,
+        min_cost_to_increase=2 * bet,
+        hand_log=[
+            {"player_id": 1, "stack_before": STACK, "action": "bet", "cost": bet, "stage": "flop"},
+        ],
+        players=make_players(stack=STACK, total_bet=100, bets={1: bet}),
+        hand_id=2,
+    )
+
+
+class PostflopValueRaiseTest(unittest.TestCase):
+    def test_strong_hand_raises_a_loose_bettor(self):
+        # Top set facing a bet from a loose player takes the value-raise branch,
+        # which sizes the raise from the bet to match
+        agent = make_agent()
+        state = facing_flop_bet(["As", "Ad"], ["Ah", "7c", "2d"])
+        action = agent.decide_action(state)
+        self.assertEqual(action["action"], "increase")
+        self.assertGreaterEqual(action["amount"], state["min_cost_to_increase"])
+        self.assertLessEqual(action["amount"], state["your_status"]["stack"])
+
+    def test_raise_is_sized_down_only_on_wet_boards(self):
+        # 2.5 * bet + pot, cut by 20% when the board is wet
+        dry = make_agent().decide_action(facing_flop_bet(["As", "Ad"], ["Ah", "7c", "2d"]))
+        two_tone = make_agent().decide_action(facing_flop_bet(["As", "Ad"], ["Ah", "7h", "2d"]))
+        self.assertEqual(dry, {"action": "increase", "amount": 675})
+        self.assertEqual(two_tone, {"action": "increase", "amount": 540})
+
+
+class BoardTextureTest(unittest.TestCase):
+    @staticmethod
+    def rank_bits(*ranks):
+        return sum(1 << r for r in ranks)
+
+    def test_four_ranks_in_a_window_is_straight_texture(self):
+        self.assertTrue(_board_has_straight_texture(self.rank_bits(9, 10, 11, 13)))
+        self.assertTrue(_board_has_straight_texture(self.rank_bits(10, 11, 12, 13, 14)))
+
+    def test_wheel_ranks_count_as_straight_texture(self):
+        self.assertTrue(_board_has_straight_texture(self.rank_bits(14, 2, 3, 5)))
+
+    def test_spread_board_has_no_straight_texture(self):
+        self.assertFalse(_board_has_straight_texture(self.rank_bits(14, 7, 2)))
+        self.assertFalse(_board_has_straight_texture(self.rank_bits(2, 3, 8, 9, 14)))
+
+
+if __name__ == "__main__":
+    unittest.main()